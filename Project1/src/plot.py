@@ -1,25 +1,42 @@
+import contextlib
+import io
 import os
 import subprocess
 import sys
 from collections import defaultdict
-import matplotlib.pyplot as plt
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from f404rtos.analysis import read_taskset, run_uniprocessor_batch, exit_code
+
+def edf_exit_codes(task_files):
+    """
+    Exit codes of main.py with edf for all the tasksets, computed in this process:
+    the simulations run in batches, see run_uniprocessor_batch
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        task_sets = [read_taskset(task_file) for task_file in task_files]
+        results = run_uniprocessor_batch(task_sets, "edf")
+    return [exit_code(*result) for result in results]
 
 def run_main_py(taskset_dir, chosenAlg):
     exit_code_counts = defaultdict(int)
 
-    for root, _, files in os.walk(taskset_dir):
-        for file in files:
-            task_file = os.path.join(root, file)
-            if chosenAlg != "edf":
-                command = [sys.executable, os.path.join(script_dir, "main.py"), "edf", task_file]
-                result = subprocess.run(command, capture_output=True)
-                if result.returncode == 3 or result.returncode == 2:
-                    exit_code_counts[4] += 1
-                    continue
+    task_files = [os.path.join(root, file) for root, _, files in os.walk(taskset_dir) for file in files]
+    edf_codes = edf_exit_codes(task_files)
+    for task_file, edf_code in zip(task_files, edf_codes):
+        file = os.path.basename(task_file)
+        if chosenAlg != "edf":
+            if edf_code == 3 or edf_code == 2:
+                exit_code_counts[4] += 1
+                continue
             command = [sys.executable, os.path.join(script_dir, "main.py"), chosenAlg, task_file]
-            result = subprocess.run(command, capture_output=True)
-            exit_code_counts[result.returncode] += 1
-            print(f"Running {file} with {chosenAlg}, exit code: {result.returncode}")
+            returncode = subprocess.run(command, capture_output=True).returncode
+        else:
+            returncode = edf_code
+        exit_code_counts[returncode] += 1
+        print(f"Running {file} with {chosenAlg}, exit code: {returncode}")
 
     return exit_code_counts
 
@@ -57,6 +74,8 @@ if __name__ == "__main__":
     sizes = [success_count, failure_count, infeasible_count]
     colors = ['green', 'red', 'gray']
 
+    # matplotlib is only needed once all the tasksets ran
+    import matplotlib.pyplot as plt
     # Plot pie chart with better configurations
     fig, ax = plt.subplots()
     wedges, texts, autotexts = ax.pie(
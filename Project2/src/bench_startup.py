@@ -0,0 +1,88 @@
+# Purpose: Measure the import time of main.py for each version and check it against a budget.
+# main.py is started once per taskset by the benchmarks (plot_exec_time.py, ../../Project1/src/plot.py),
+# so the modules of the versions that do not run must not be imported, see the imports of f404rtos/analysis.py
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# a taskset the preprocessors decide for every version, so no simulation module is needed
+LIGHT_TASKSET = "0,1,10,10\n0,1,20,20\n0,2,40,40\n"
+
+# arguments of main.py, and the modules it must not import, for each version
+VERSIONS = {
+    "partitioned": (["-v", "partitioned", "-h", "ff", "-s", "du"], ["f404rtos.simulation_functions"]),
+    "global": (["-v", "global"], ["f404rtos.partitioner", "f404rtos.simulation_functions", "concurrent.futures", "f404rtos.myglobal"]),
+    "k": (["-v", "2"], ["f404rtos.partitioner", "f404rtos.simulation_functions", "concurrent.futures", "f404rtos.myglobal"]),
+}
+
+def parseArgs():
+    """
+    parse command line arguments
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=float, default=50.0,
+                        help="Maximum import time of main.py in milliseconds, for every version (default: 50)")
+    parser.add_argument("--runs", type=int, default=11, help="Number of runs of each version, the fastest is kept (default: 11)")
+    return parser.parse_args()
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Returns the cumulative import time in microseconds of each module imported at the top level,
+    from the output of python -X importtime
+    """
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # nested imports are indented, they are already counted in the cumulative time of their parent
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+def imported_modules(stderr: str) -> set:
+    return {line.split("|")[2].strip() for line in stderr.splitlines()
+            if line.startswith("import time:") and "cumulative" not in line}
+
+def measure(arguments, baseline_modules: set):
+    """
+    Run main.py once, returns the time spent importing the modules the interpreter does not import anyway (ms),
+    and the set of the modules imported
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", os.path.join(SRC_DIR, "main.py")] + arguments,
+                            capture_output=True, text=True, cwd=SRC_DIR)
+    imports = parse_importtime(result.stderr)
+    import_time = sum(cumulative for name, cumulative in imports.items() if name not in baseline_modules) / 1000
+    return import_time, imported_modules(result.stderr)
+
+
+if __name__ == "__main__":
+    args = parseArgs()
+    baseline = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True)
+    baseline_modules = imported_modules(baseline.stderr)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as taskset_file:
+        taskset_file.write(LIGHT_TASKSET)
+    over_budget = False
+    try:
+        for version, (version_arguments, forbidden_modules) in VERSIONS.items():
+            arguments = [taskset_file.name, "2"] + version_arguments
+            import_times = []
+            for _ in range(args.runs):
+                import_time, modules = measure(arguments, baseline_modules)
+                import_times.append(import_time)
+            import_times.sort()
+            fastest = import_times[0]
+            unexpected_modules = sorted(module for module in forbidden_modules if module in modules)
+            passed = fastest <= args.budget and not unexpected_modules
+            over_budget = over_budget or not passed
+            print(f"{version:12s} import time {fastest:6.1f} ms (budget {args.budget:.0f} ms)"
+                  + (f", imports {', '.join(unexpected_modules)}" if unexpected_modules else "")
+                  + ("" if passed else "  FAILED"))
+    finally:
+        os.remove(taskset_file.name)
+    sys.exit(1 if over_budget else 0)
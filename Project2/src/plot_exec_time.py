@@ -1,7 +1,6 @@
 import os
 import subprocess
 import time
-import matplotlib.pyplot as plt
 
 def get_tasksets(directory):
     return [os.path.join(directory, f) for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
@@ -44,6 +43,8 @@ def main():
     for i, (avg_time, timeout_count) in enumerate(zip(avg_times, timeouts)):
         print(f"Average execution time for {i+1} workers: {avg_time:.4f} seconds with {timeout_count} timeouts")
 
+    # matplotlib is only needed once all the runs are timed
+    import matplotlib.pyplot as plt
     plt.plot(range(1, 33), avg_times)
     plt.xlabel('Number of workers')
     plt.ylabel('Average execution time (seconds)')
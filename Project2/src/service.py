@@ -0,0 +1,293 @@
+# Purpose: Long running analysis service, so an orchestration layer does not pay the start of python for every taskset.
+# Requests and responses are JSON lines, on stdin/stdout or on a Unix socket:
+#   {"id": 1, "tasks": [[O, C, D, T], ...], "m": 4, "v": "partitioned", "h": "ff", "s": "du", "p": "edf"}
+#   {"id": 2, "file": "tasksets/taskset-0", "m": 8, "v": "global"}
+#   {"id": 3, "file": "tasksets/taskset-0", "m": 8, "v": "clustered", "c": 2, "h": "ff", "s": "du"}
+# Each response gives back the id with the exit code of main.py and its three flags.
+# The requests are handled in batches: the analytical checks run in the event loop,
+# the tasksets that need a simulation are sent to a process pool. Verdicts are cached
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import io
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from f404rtos import datatypes
+from f404rtos.analysis import read_taskset, run, exit_code, GREEDY_HEURISTICS, PARTITION_METHODS, PARTITION_ORDERINGS
+from f404rtos.scheduling_functions import SCHEDULING_POLICIES
+
+def parseArgs():
+    """
+    parse command line arguments
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--socket", help="Path of a Unix socket to listen on (default: stdin/stdout)")
+    parser.add_argument("-w", type=int, help="Number of simulation processes (default: # of cpu cores on the machine)")
+    parser.add_argument("--batch-size", type=int, default=64, help="Maximum number of requests of a batch (default: 64)")
+    parser.add_argument("--batch-window", type=float, default=0,
+                        help="Seconds to wait for more requests before a batch is handled (default: 0, only the queued ones)")
+    parser.add_argument("--cache-size", type=int, default=100000, help="Number of verdicts kept in the cache (default: 100000)")
+    return parser.parse_args()
+
+def parse_request(request: dict):
+    """
+    Returns the taskset and the normalized configuration of a request, raises ValueError if the request is not valid.
+    The options a version does not use are dropped, so they do not split the cache
+    """
+    if "tasks" in request:
+        task_set = datatypes.TaskSet([datatypes.Task(task_id=i, name="Task_" + str(i), offset=int(O),
+                                                     computation_time=int(C), deadline=int(D), period=int(T))
+                                      for i, (O, C, D, T) in enumerate(request["tasks"])])
+    elif "file" in request:
+        if not os.path.isfile(request["file"]):
+            raise ValueError(f"file not found: {request['file']}")
+        with contextlib.redirect_stdout(io.StringIO()):
+            task_set = read_taskset(request["file"])
+    else:
+        raise ValueError("a request needs 'tasks' or 'file'")
+    if len(task_set.tasks) == 0:
+        raise ValueError("the taskset is empty")
+
+    num_cores = int(request["m"])
+    version = request.get("v", "partitioned")
+    heuristic, ordering, policy, cluster_size = None, None, "edf", None
+    if version == "partitioned":
+        heuristic, ordering, policy = request.get("h"), request.get("s"), request.get("p", "edf")
+        # the analytical checks run in the event loop, the branch and bound would hold every client for up to its timeout
+        if heuristic == "bb":
+            raise ValueError("the branch and bound is not available in the service, use main.py -h bb")
+        if heuristic not in PARTITION_METHODS:
+            raise ValueError(f"unknown heuristic {heuristic}, choose from {', '.join(GREEDY_HEURISTICS)}")
+        if ordering not in PARTITION_ORDERINGS:
+            raise ValueError(f"unknown ordering {ordering}, choose from {', '.join(PARTITION_ORDERINGS)}")
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"unknown policy {policy}, choose from {', '.join(SCHEDULING_POLICIES)}")
+    elif version == "clustered":
+        heuristic, ordering, cluster_size = request.get("h"), request.get("s"), int(request["c"])
+        if heuristic not in GREEDY_HEURISTICS:
+            raise ValueError(f"unknown heuristic {heuristic}, choose from {', '.join(GREEDY_HEURISTICS)}")
+        if ordering not in PARTITION_ORDERINGS:
+            raise ValueError(f"unknown ordering {ordering}, choose from {', '.join(PARTITION_ORDERINGS)}")
+        if cluster_size < 1 or num_cores % cluster_size != 0:
+            raise ValueError(f"the cluster size {cluster_size} must divide the number of cores {num_cores}")
+    elif version not in ["global", "edfk-auto", "semi"]:
+        version = int(version)
+    return task_set, (num_cores, version, heuristic, ordering, policy, cluster_size)
+
+def cache_key(task_set: datatypes.TaskSet, configuration: tuple) -> tuple:
+    tasks = tuple((task.offset, task.computation_time, task.deadline, task.period) for task in task_set.tasks)
+    return (tasks,) + configuration
+
+def analyse(task_set: datatypes.TaskSet, configuration: tuple, allow_simulation: bool):
+    num_cores, version, heuristic, ordering, policy, cluster_size = configuration
+    # main.py prints a lot, and stdout may be the channel of the responses
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run(task_set, num_cores, version, heuristic, ordering, 1, policy, allow_simulation, cluster_size=cluster_size)
+
+def simulate(task_set: datatypes.TaskSet, configuration: tuple):
+    """
+    Run in a worker process of the pool: the full check, with the simulations
+    """
+    return analyse(task_set, configuration, allow_simulation=True)
+
+
+class AnalysisService:
+    def __init__(self, num_workers: int, batch_size: int, batch_window: float, cache_size: int) -> None:
+        self.pool = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers)
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.cache_size = cache_size
+        # least recently used verdicts first
+        self.verdicts = collections.OrderedDict()
+        # simulations in progress, so the same taskset is not simulated twice at the same time
+        self.pending = {}
+        self.queue = asyncio.Queue()
+        self.stats = {"requests": 0, "cache_hits": 0, "analytical": 0, "simulated": 0, "errors": 0}
+
+    async def submit(self, request: dict) -> dict:
+        """
+        Queue a request for the next batch and wait for its response
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future, time.perf_counter()))
+        return await future
+
+    async def batcher(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            # take what is already queued, then wait up to the batch window for more
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            deadline = time.perf_counter() + self.batch_window
+            while len(batch) < self.batch_size and self.batch_window > 0:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            self.handle_batch(batch)
+
+    def handle_batch(self, batch) -> None:
+        """
+        Answer the cache hits and the tasksets decided by the analytical checks at once,
+        and send the others to the process pool
+        """
+        for request, future, start_time in batch:
+            self.stats["requests"] += 1
+            request_id = request.get("id") if isinstance(request, dict) else None
+            try:
+                task_set, configuration = parse_request(request)
+            except (ValueError, KeyError, TypeError) as e:
+                self.stats["errors"] += 1
+                future.set_result({"id": request_id, "error": str(e)})
+                continue
+            key = cache_key(task_set, configuration)
+
+            if key in self.verdicts:
+                self.stats["cache_hits"] += 1
+                self.verdicts.move_to_end(key)
+                future.set_result(self.response(request_id, self.verdicts[key], start_time, "cache"))
+                continue
+            if key in self.pending:
+                self.pending[key].add_done_callback(
+                    lambda simulation, request_id=request_id, future=future, start_time=start_time:
+                        self.answer_simulation(simulation, request_id, future, start_time))
+                continue
+
+            verdict = analyse(task_set, configuration, allow_simulation=False)
+            if verdict is not None:
+                self.stats["analytical"] += 1
+                self.store(key, verdict)
+                future.set_result(self.response(request_id, verdict, start_time, "analysis"))
+                continue
+
+            self.stats["simulated"] += 1
+            simulation = asyncio.wrap_future(self.pool.submit(simulate, task_set, configuration))
+            self.pending[key] = simulation
+            simulation.add_done_callback(lambda simulation, key=key: self.finish_simulation(simulation, key))
+            simulation.add_done_callback(
+                lambda simulation, request_id=request_id, future=future, start_time=start_time:
+                    self.answer_simulation(simulation, request_id, future, start_time))
+
+    def finish_simulation(self, simulation, key: tuple) -> None:
+        del self.pending[key]
+        if simulation.exception() is None:
+            self.store(key, simulation.result())
+
+    def answer_simulation(self, simulation, request_id, future, start_time: float) -> None:
+        if simulation.exception() is not None:
+            self.stats["errors"] += 1
+            future.set_result({"id": request_id, "error": str(simulation.exception())})
+        else:
+            future.set_result(self.response(request_id, simulation.result(), start_time, "simulation"))
+
+    def store(self, key: tuple, verdict: tuple) -> None:
+        self.verdicts[key] = verdict
+        if len(self.verdicts) > self.cache_size:
+            self.verdicts.popitem(last=False)
+
+    def response(self, request_id, verdict: tuple, start_time: float, source: str) -> dict:
+        is_feasible, need_simulation, cannot_tell = verdict
+        return {"id": request_id,
+                "exit_code": exit_code(is_feasible, need_simulation, cannot_tell),
+                "is_feasible": bool(is_feasible),
+                "need_simulation": bool(need_simulation),
+                "cannot_tell": bool(cannot_tell),
+                # cache, analysis or simulation
+                "source": source,
+                "time": time.perf_counter() - start_time}
+
+    async def serve_lines(self, reader: asyncio.StreamReader, write) -> None:
+        """
+        Read JSON lines from reader and write a JSON line per response as soon as it is ready,
+        the responses of one connection may come back in another order than the requests
+        """
+        async def answer(line: bytes) -> None:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                self.stats["errors"] += 1
+                response = {"id": None, "error": f"invalid JSON: {e}"}
+            else:
+                if request == "stats":
+                    response = dict(self.stats, cached_verdicts=len(self.verdicts))
+                else:
+                    response = await self.submit(request)
+            write((json.dumps(response) + "\n").encode())
+
+        answers = set()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.strip():
+                task = asyncio.create_task(answer(line))
+                answers.add(task)
+                task.add_done_callback(answers.discard)
+        if answers:
+            await asyncio.wait(answers)
+
+    async def serve_stdio(self) -> None:
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+
+        def read_stdin() -> None:
+            # a thread works for pipes, files and terminals alike, the pipe transport of asyncio only for pipes
+            for line in sys.stdin.buffer:
+                loop.call_soon_threadsafe(reader.feed_data, line)
+            loop.call_soon_threadsafe(reader.feed_eof)
+        threading.Thread(target=read_stdin, daemon=True).start()
+
+        def write(data: bytes) -> None:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+        await self.serve_lines(reader, write)
+
+    async def serve_socket(self, path: str) -> None:
+        async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            try:
+                await self.serve_lines(reader, writer.write)
+            finally:
+                writer.close()
+        server = await asyncio.start_unix_server(handle_client, path=path)
+        print(f"listening on {path}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    async def serve(self, socket_path: str = None) -> None:
+        batcher = asyncio.create_task(self.batcher())
+        try:
+            if socket_path is None:
+                await self.serve_stdio()
+            else:
+                await self.serve_socket(socket_path)
+        finally:
+            batcher.cancel()
+            self.pool.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    args = parseArgs()
+    num_workers = args.w if args.w is not None else os.cpu_count()
+    # stop like on ctrl-c, so the socket is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    service = AnalysisService(num_workers, args.batch_size, args.batch_window, args.cache_size)
+    try:
+        asyncio.run(service.serve(args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.socket is not None and os.path.exists(args.socket):
+            os.remove(args.socket)
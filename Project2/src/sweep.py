@@ -0,0 +1,223 @@
+# Purpose: Run every taskset of a corpus over a grid of (version x heuristic x ordering x m) configurations
+# and write one tidy results table, one row per taskset and configuration.
+# The corpus and the results sit in shared memory (see f404rtos/shared_corpus.py), the workers only receive taskset indexes
+import argparse
+import concurrent.futures
+import contextlib
+import csv
+import io
+import os
+import sys
+import time
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from f404rtos.analysis import (read_taskset, run, check_partitioned, exit_code, PARTITION_METHODS, PARTITION_ORDERINGS,
+                               GREEDY_HEURISTICS)
+from f404rtos.partitioner import Partitioner, Processor
+from f404rtos.scheduling_functions import SCHEDULING_POLICIES
+from f404rtos.shared_corpus import SharedCorpus, UNASSIGNED
+
+RESULT_COLUMNS = ["taskset", "version", "policy", "heuristic", "ordering", "m",
+                  "exit_code", "is_feasible", "need_simulation", "cannot_tell", "time", "repaired", "partition"]
+
+# the corpus, the configurations and the time budgets of the partitioners of a worker process, set once by attach_worker
+worker_corpus = None
+worker_configurations = None
+worker_repair_budget = None
+worker_bb_timeout = None
+
+def parseArgs():
+    """
+    parse command line arguments
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("corpus", nargs="+", help="Taskset files or directories of taskset files")
+    parser.add_argument("-m", required=True, help="Comma separated numbers of cores, e.g. 2,4,8")
+    parser.add_argument("-v", default="partitioned",
+                        help="Comma separated versions of EDF ('global', 'partitioned', 'semi', <k>, 'edfk-auto'), default: partitioned")
+    parser.add_argument("-h", default=",".join(GREEDY_HEURISTICS),
+                        help="Comma separated heuristics for partitioned EDF, 'bb' for the branch and bound (exact for synchronous tasksets), default: ff,nf,bf,wf")
+    parser.add_argument("-s", default="iu,du", help="Comma separated orderings for partitioned EDF (iu, du, dd, ddl), default: iu,du")
+    parser.add_argument("-p", default="edf", help="Comma separated scheduling policies of each core for partitioned mode, default: edf")
+    parser.add_argument("--repair", type=float, nargs="?", const=1.0, metavar="SECONDS",
+                        help="Repair the partitions the heuristics fail by moves and swaps of tasks, for up to SECONDS seconds each (default: 1)")
+    parser.add_argument("--bb-timeout", type=float, default=10.0,
+                        help="Seconds before the branch and bound of a partition gives up, the row then has cannot_tell set (default: 10)")
+    parser.add_argument("-w", type=int, help="Number of worker processes (default: # of cpu cores on the machine)")
+    parser.add_argument("-o", default="sweep_results.csv", help="Output table, .csv or .parquet")
+    args = parser.parse_args()
+
+    args.m = [int(num_cores) for num_cores in args.m.split(",")]
+    args.v = args.v.split(",")
+    args.h = args.h.split(",")
+    args.s = args.s.split(",")
+    args.p = args.p.split(",")
+    for version in args.v:
+        if version == "clustered":
+            parser.error("'clustered' is not available in the sweep, use main.py -v clustered -c <cluster_size>")
+        if version not in ["global", "partitioned", "semi", "edfk-auto"]:
+            try:
+                int(version)
+            except ValueError:
+                parser.error(f"unknown version {version}, choose from global, partitioned, semi, edfk-auto or an integer value for EDF^k")
+    for heuristic in args.h:
+        if heuristic not in PARTITION_METHODS:
+            parser.error(f"unknown heuristic {heuristic}, choose from {', '.join(PARTITION_METHODS)}")
+    for ordering in args.s:
+        if ordering not in PARTITION_ORDERINGS:
+            parser.error(f"unknown ordering {ordering}, choose from {', '.join(PARTITION_ORDERINGS)}")
+    for policy in args.p:
+        if policy not in SCHEDULING_POLICIES:
+            parser.error(f"unknown policy {policy}, choose from {', '.join(SCHEDULING_POLICIES)}")
+    return args
+
+def list_tasksets(corpus):
+    taskset_files = []
+    for path in corpus:
+        if os.path.isdir(path):
+            taskset_files.extend(sorted(os.path.join(path, f) for f in os.listdir(path)
+                                        if os.path.isfile(os.path.join(path, f))))
+        else:
+            taskset_files.append(path)
+    return taskset_files
+
+def make_configurations(versions, policies, heuristics, orderings, cores):
+    """
+    List the (version, policy, heuristic, ordering, m) configurations of the grid,
+    policy, heuristic and ordering are only used by the partitioned version
+    """
+    configurations = []
+    for version in versions:
+        for num_cores in cores:
+            if version == "partitioned":
+                for policy in policies:
+                    for heuristic in heuristics:
+                        for ordering in orderings:
+                            configurations.append((version, policy, heuristic, ordering, num_cores))
+            else:
+                configurations.append((version, "edf", None, None, num_cores))
+    return configurations
+
+def attach_worker(corpus_descriptor: tuple, configurations, repair_budget: float, bb_timeout: float) -> None:
+    """
+    Initializer of the worker processes: attach to the shared corpus once instead of receiving tasksets
+    """
+    global worker_corpus, worker_configurations, worker_repair_budget, worker_bb_timeout
+    worker_corpus = SharedCorpus.attach(corpus_descriptor)
+    worker_configurations = configurations
+    worker_repair_budget = repair_budget
+    worker_bb_timeout = bb_timeout
+
+def sweep_taskset(taskset_index: int) -> None:
+    """
+    Read the taskset from the shared corpus and check it for every configuration,
+    the verdicts and the partitions are written back to the shared corpus.
+    The per-core verdicts only depend on the tasks of the core, so they are shared by all partitioned configurations
+    """
+    task_set = worker_corpus.read_taskset(taskset_index)
+    verdict_cache = {}
+    for configuration_index, (version, policy, heuristic, ordering, num_cores) in enumerate(worker_configurations):
+        start_time = time.perf_counter_ns()
+        repaired_tasks = 0
+        # the partitioner and the preprocessors print a lot, keep the workers quiet
+        with contextlib.redirect_stdout(io.StringIO()):
+            if version == "partitioned":
+                processor_list = [Processor(i) for i in range(num_cores)]
+                partitioner = Partitioner(task_set, processor_list, ordering, policy, worker_repair_budget, worker_bb_timeout)
+                partition_is_possible = partitioner.partition(PARTITION_METHODS[heuristic])
+                repaired_tasks = partitioner.repaired_tasks
+                if partition_is_possible:
+                    # the process pool already uses the cores, check the processors one after the other
+                    is_feasible, need_simulation, cannot_tell = check_partitioned(processor_list, 1, verdict_cache, policy)
+                    worker_corpus.write_assignment(taskset_index, configuration_index,
+                                                   {task.task_id: processor_index
+                                                    for processor_index, processor in enumerate(processor_list)
+                                                    for task in processor.task_set.tasks})
+                else:
+                    # cannot tell if the branch and bound gave up, or found no partition of an asynchronous taskset
+                    is_feasible, need_simulation, cannot_tell = False, False, partitioner.cannot_tell
+            else:
+                is_feasible, need_simulation, cannot_tell = run(task_set, num_cores, version)
+        worker_corpus.write_result(taskset_index, configuration_index,
+                                   [exit_code(is_feasible, need_simulation, cannot_tell),
+                                    bool(is_feasible), bool(need_simulation), bool(cannot_tell),
+                                    time.perf_counter_ns() - start_time, repaired_tasks])
+
+def collect_rows(corpus: SharedCorpus, taskset_files, configurations, done_tasksets) -> list:
+    """
+    Turn the shared results of the tasksets that were checked into one row per taskset and configuration
+    """
+    rows = []
+    for taskset_index in done_tasksets:
+        for configuration_index, (version, policy, heuristic, ordering, num_cores) in enumerate(configurations):
+            result = corpus.read_result(taskset_index, configuration_index)
+            assignment = corpus.read_assignment(taskset_index, configuration_index)
+            rows.append({
+                "taskset": taskset_files[taskset_index],
+                "version": version,
+                "policy": policy,
+                "heuristic": heuristic,
+                "ordering": ordering,
+                "m": num_cores,
+                "exit_code": result["exit_code"],
+                "is_feasible": bool(result["is_feasible"]),
+                "need_simulation": bool(result["need_simulation"]),
+                "cannot_tell": bool(result["cannot_tell"]),
+                "time": result["time_ns"] / 1e9,
+                # tasks placed by the repair, see Partitioner.repair
+                "repaired": result["repaired_tasks"],
+                # processor of each task, in the order of the taskset file
+                "partition": "" if UNASSIGNED in assignment else " ".join(map(str, assignment)),
+            })
+    return rows
+
+def write_results(rows, output_file: str):
+    if output_file.endswith(".parquet"):
+        try:
+            import pandas
+        except ImportError:
+            raise SystemExit("Parquet output needs pandas and pyarrow, use a .csv output instead")
+        pandas.DataFrame(rows, columns=RESULT_COLUMNS).to_parquet(output_file, index=False)
+        return
+    with open(output_file, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    args = parseArgs()
+    num_workers = args.w if args.w is not None else os.cpu_count()
+    taskset_files = list_tasksets(args.corpus)
+    configurations = make_configurations(args.v, args.p, args.h, args.s, args.m)
+    print(f"{len(taskset_files)} tasksets x {len(configurations)} configurations on {num_workers} workers")
+
+    # parse the corpus once in the main process
+    corpus = SharedCorpus.create([read_taskset(taskset_file) for taskset_file in taskset_files], len(configurations))
+    done_tasksets = []
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers, initializer=attach_worker,
+                                                    initargs=(corpus.descriptor(), configurations, args.repair,
+                                                              args.bb_timeout)) as executor:
+            futures = {executor.submit(sweep_taskset, taskset_index): taskset_index
+                       for taskset_index in range(len(taskset_files))}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                    done_tasksets.append(futures[future])
+                except Exception as e:
+                    print(f"Error occurred for {taskset_files[futures[future]]}: {e}")
+        rows = collect_rows(corpus, taskset_files, configurations, done_tasksets)
+    finally:
+        corpus.close()
+
+    # one stable order, whatever the order the workers finished in
+    rows.sort(key=lambda row: (row["taskset"], row["version"], row["policy"], row["m"], row["heuristic"] or "", row["ordering"] or ""))
+    write_results(rows, args.o)
+    print(f"{len(rows)} results written to {args.o}")
+    if args.repair is not None:
+        repaired_rows = [row for row in rows if row["repaired"] > 0]
+        print(f"repair: {len(repaired_rows)} partitions needed a repair, "
+              f"{sum(row['is_feasible'] for row in repaired_rows)} of them are schedulable")
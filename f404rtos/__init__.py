@@ -0,0 +1,12 @@
+"""
+Real-time scheduling analyses and simulators of the ULB INFO-F404 projects:
+one processor with EDF, DM, RM or round robin (Project 1),
+partitioned EDF, global EDF and EDF^(k) on m processors (Project 2).
+"""
+from .datatypes import Task, Job, TaskSet, NewBool, SimulationStats, TaskStats, MissHandling, MISS_POLICIES
+from .scheduling_functions import SchedulingPolicy, SCHEDULING_POLICIES, get_policy
+from .preprocessor import Preprocessor
+from .analysis import (PARTITION_METHODS, PARTITION_ORDERINGS, read_taskset, run, run_uniprocessor, run_uniprocessor_batch,
+                       exit_code, check_partitioned, find_min_cores_partitioned, find_min_cores_global)
+
+__version__ = "0.1.0"
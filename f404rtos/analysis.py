@@ -0,0 +1,671 @@
+# Purpose: Check a taskset on one processor with a scheduling policy, or with a version of EDF
+# (partitioned, global, EDF^k) on m processors.
+# These are the functions behind both CLIs, for the tools that run them in process (sweep, service).
+# The modules of one version only are imported when it runs (partitioner, simulation_functions,
+# concurrent.futures...), the CLI is started thousands of times by the benchmarks, see bench_startup.py
+from . import datatypes
+from .datatypes import *
+from .scheduling_functions import SCHEDULING_POLICIES, SchedulingPolicy, get_policy
+from .preprocessor import Preprocessor
+import dataclasses
+import math
+
+from . import help_functions
+
+PARTITION_METHODS = {
+    "ff": "first_fit",
+    "nf": "next_fit",
+    "bf": "best_fit",
+    "wf": "worst_fit",
+    "bb": "branch_and_bound"
+}
+# the heuristics tried by -h auto and --min-cores, the branch and bound is exact for synchronous tasksets but can take much longer
+GREEDY_HEURISTICS = ["ff", "nf", "bf", "wf"]
+
+# orderings of the tasks before the partition
+PARTITION_ORDERINGS = {
+    "iu": "increasing utilization",
+    "du": "decreasing utilization",
+    "dd": "decreasing density",
+    "ddl": "decreasing deadline"
+}
+
+def read_taskset(taskset_file: str) -> TaskSet:
+    """
+    Read a taskset file with one task O, C, D, T per line
+    """
+    tasks = []
+    try:
+        with open(taskset_file, 'r') as file:
+            for i, line in enumerate(file):
+                data = line.split(",")
+                O, C, D, T = map(int, data)
+                new_task = datatypes.Task(
+                    task_id=i,
+                    name="Task_" + str(i),
+                    offset=O,
+                    computation_time=C,
+                    deadline=D,
+                    period=T,
+                )
+                tasks.append(new_task)
+    except FileNotFoundError:
+        print("File not found, please check the provided path")
+    return datatypes.TaskSet(tasks)
+
+
+def run_uniprocessor(task_set: TaskSet, scheduling_algorithm: str, quantum: int = None, stats: SimulationStats = None,
+                     miss_handling: MissHandling = None):
+    """
+    Check the taskset on one processor with a scheduling policy ('edf', 'dm', 'rm', 'rr'),
+    returns is_feasible, need_simulation and cannot_tell like run().
+    quantum is the time quantum of rr in the time units of the taskset, the simulator timestep by default.
+    stats is filled by the simulation if one runs, it goes on after a deadline miss if miss_handling is given.
+    With miss_handling, a taskset the preprocessor rejects is simulated anyway, to measure the overload
+    """
+    preprocessor = Preprocessor(task_set, scheduling_algorithm)
+    prep_is_feasible = preprocessor.preprocess()
+    if prep_is_feasible == NewBool.FALSE and miss_handling is not None:
+        preprocessor.set_feasibility_interval()
+        preprocessor.set_simulator_timestep()
+    elif prep_is_feasible != NewBool.CANNOT_TELL:
+        return prep_is_feasible == NewBool.TRUE, False, False
+
+    from .simulation_functions import schedule, schedule_round_robin
+    # the preprocessor rescaled the taskset by the gcd of C, T, D, O
+    scaled_task_set = preprocessor.task_set
+    feasibility_interval = scaled_task_set.to_original_time(preprocessor.feasibility_interval)
+    print(f"Simulation is needed, feasibility interval = {feasibility_interval}"
+          + (f", offsets shifted by {preprocessor.offset_shift} (the times of the simulation are that much earlier)"
+             if preprocessor.offset_shift > 0 else ""))
+    if get_policy(scheduling_algorithm).is_round_robin and quantum is not None:
+        # the quantum must be a multiple of the time unit
+        time_scale = math.gcd(scaled_task_set.time_scale, quantum)
+        schedule_passed = schedule_round_robin(task_set.shifted(preprocessor.offset_shift).rescaled(time_scale),
+                                               feasibility_interval // time_scale, 1,
+                                               quantum // time_scale, stats=stats, miss_handling=miss_handling)
+    else:
+        schedule_passed = schedule(scaled_task_set, scheduling_algorithm, preprocessor.feasibility_interval,
+                                   preprocessor.simulator_timestep, stats=stats, miss_handling=miss_handling)
+    # CANNOT_TELL if the time budget of miss_handling ran out
+    return schedule_passed == NewBool.TRUE, True, schedule_passed == NewBool.CANNOT_TELL
+
+def run_uniprocessor_batch(task_sets: List[TaskSet], scheduling_algorithm: str = "edf", batch_size: int = 1024):
+    """
+    Check many tasksets on one processor, returns the is_feasible, need_simulation and cannot_tell of each like run_uniprocessor.
+    With EDF and numpy installed, the tasksets that need a simulation are simulated batch_size at a time
+    by schedule_edf_batch, those with similar lengths of simulation together. Otherwise they are simulated one by one
+    """
+    results = [None] * len(task_sets)
+    simulations = []
+    for index, task_set in enumerate(task_sets):
+        preprocessor = Preprocessor(task_set, scheduling_algorithm)
+        prep_is_feasible = preprocessor.preprocess()
+        if prep_is_feasible != NewBool.CANNOT_TELL:
+            results[index] = (prep_is_feasible == NewBool.TRUE, False, False)
+        else:
+            simulations.append((index, preprocessor))
+
+    schedule_edf_batch = None
+    if get_policy(scheduling_algorithm).name == "edf":
+        try:
+            from .batch_simulation import schedule_edf_batch
+        except ImportError:
+            pass
+    if schedule_edf_batch is None:
+        from .simulation_functions import schedule
+        for index, preprocessor in simulations:
+            schedule_passed = schedule(preprocessor.task_set, scheduling_algorithm, preprocessor.feasibility_interval,
+                                       preprocessor.simulator_timestep)
+            results[index] = (schedule_passed == NewBool.TRUE, True, False)
+        return results
+
+    # a batch runs as long as its longest simulation
+    simulations.sort(key=lambda simulation: simulation[1].feasibility_interval // simulation[1].simulator_timestep)
+    for start in range(0, len(simulations), batch_size):
+        batch = simulations[start:start + batch_size]
+        verdicts = schedule_edf_batch([preprocessor.task_set for _, preprocessor in batch],
+                                      [preprocessor.feasibility_interval for _, preprocessor in batch],
+                                      [preprocessor.simulator_timestep for _, preprocessor in batch])
+        for (index, _), verdict in zip(batch, verdicts):
+            results[index] = (verdict == NewBool.TRUE, True, False)
+    return results
+
+def preprocess_processor(processor: 'Processor', preprocessor: Preprocessor, synchronous_preprocessor: Preprocessor,
+                         policy: SchedulingPolicy):
+    """
+    Returns the verdict of the preprocessors of the taskset of processor and of its synchronous version,
+    and the verdict of the synchronous one alone (None if the policy does not look at the synchronous taskset)
+    """
+    if policy.is_fixed_priority and len(processor.response_times) == len(processor.task_set.tasks):
+        # the partitioner already checked every response time of the processor
+        processor.log.append(f"Processor{processor.processor_id} response times: {processor.response_times}")
+        return NewBool.TRUE, NewBool.TRUE
+
+    synchronous_prep_is_feasible = None
+    if policy.synchronous_is_worst_case:
+        synchronous_prep_is_feasible = synchronous_preprocessor.preprocess()
+        processor.log.append(f"synchronous preprocess passed? : {synchronous_prep_is_feasible}")
+
+        if synchronous_prep_is_feasible == NewBool.TRUE:
+            return NewBool.TRUE, synchronous_prep_is_feasible
+
+    # FALSE or CANNOT_TELL, continue the asynchronous preprocess
+    prep_is_feasible = preprocessor.preprocess()
+    if preprocessor.offset_shift > 0:
+        processor.log.append(f"Processor{processor.processor_id} offsets shifted by {preprocessor.offset_shift}")
+    processor.log.append(f"Processor{processor.processor_id} preprocess passed? : {prep_is_feasible}")
+
+    # TRUE, FALSE, or CANNOT_TELL to start the simulation
+    return prep_is_feasible, synchronous_prep_is_feasible
+
+def simulate_processor(processor: 'Processor', preprocessor: Preprocessor, synchronous_preprocessor: Preprocessor,
+                       policy: SchedulingPolicy, simulate_synchronous: bool = True)-> NewBool:
+    """
+    Simulate the tasksets prepared by the preprocessors of preprocess_processor
+    """
+    from .simulation_functions import schedule
+    if simulate_synchronous:
+        # simulate the synchronous taskset first
+        schedulePassed = schedule(task_set=synchronous_preprocessor.task_set,
+                                  scheduling_function=policy,
+                                  time_max=synchronous_preprocessor.feasibility_interval,
+                                  time_step=synchronous_preprocessor.simulator_timestep,
+                                  processor=processor,
+                                  stats=processor.stats,
+                                  miss_handling=processor.miss_handling)
+
+        if schedulePassed == NewBool.CANNOT_TELL:
+            # stopped by another processor, or the time budget of miss_handling ran out
+            return NewBool.CANNOT_TELL
+        if schedulePassed:
+            return NewBool.TRUE
+        if processor.stats is not None:
+            # keep the statistics of the simulation that gives the verdict
+            for task in processor.task_set.tasks:
+                processor.stats.tasks.pop(task.task_id, None)
+
+    # synchronous simulation failed, start asynchronous simulation
+    # check the feasibility_interval first, because the asynchrounous simulation will not stop early
+    schedulePassed = schedule(task_set=preprocessor.task_set,
+                              scheduling_function=policy,
+                              time_max=preprocessor.feasibility_interval,
+                              time_step=preprocessor.simulator_timestep,
+                              processor=processor,
+                              stats=processor.stats,
+                              miss_handling=processor.miss_handling)
+    return schedulePassed
+
+def simulate_portfolio_worker(run_name: str, processor_id: int, task_set: TaskSet, policy_name: str, time_max: int,
+                              time_step: int, with_stats: bool, miss_handling: MissHandling, results) -> None:
+    """
+    Run in a worker process of simulate_processor_portfolio: one simulation,
+    its verdict, log and statistics are sent back through results
+    """
+    from .partitioner import Processor
+    from .simulation_functions import schedule
+    processor = Processor(processor_id)
+    processor.stats = SimulationStats() if with_stats else None
+    processor.miss_handling = miss_handling
+    result = schedule(task_set, policy_name, time_max, time_step, processor=processor,
+                      stats=processor.stats, miss_handling=miss_handling)
+    results.put((run_name, result, processor.log, processor.stats))
+
+def simulate_processor_portfolio(processor: 'Processor', preprocessor: Preprocessor, synchronous_preprocessor: Preprocessor,
+                                 policy: SchedulingPolicy) -> NewBool:
+    """
+    Same verdict as simulate_processor, but the synchronous and the asynchronous simulations race in two processes
+    instead of one after the other. The first conclusive verdict wins and the other simulation is stopped:
+    a synchronous taskset that passes (the synchronous release is the worst case),
+    or the asynchronous simulation over the whole feasibility interval, whatever its verdict
+    """
+    import multiprocessing
+    import queue
+    from . import myglobal
+    results = multiprocessing.Queue()
+    runs = {"synchronous": synchronous_preprocessor, "asynchronous": preprocessor}
+    workers = {run_name: multiprocessing.Process(
+                   target=simulate_portfolio_worker,
+                   args=(run_name, processor.processor_id, run_preprocessor.task_set, policy.name,
+                         run_preprocessor.feasibility_interval, run_preprocessor.simulator_timestep,
+                         processor.stats is not None, processor.miss_handling, results),
+                   daemon=True)
+               for run_name, run_preprocessor in runs.items()}
+    for worker in workers.values():
+        worker.start()
+
+    finished = {}
+    verdict = None
+    try:
+        while verdict is None:
+            if myglobal.global_stop_flag.is_set():
+                processor.log.append("other processor failed, stop the simulations")
+                return NewBool.CANNOT_TELL
+            try:
+                run_name, result, log, stats = results.get(timeout=0.01)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers.values()) and results.empty():
+                    raise RuntimeError(f"a simulation of Processor{processor.processor_id} stopped without a verdict")
+                continue
+            finished[run_name] = (result, log, stats)
+            if run_name == "asynchronous" or result == NewBool.TRUE:
+                verdict = run_name
+    finally:
+        for worker in workers.values():
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        results.close()
+
+    # logs in the order of the sequential simulations, the statistics of the one that gives the verdict
+    for run_name in runs:
+        if run_name in finished:
+            processor.log.extend(finished[run_name][1])
+    processor.log.append(f"portfolio: the {verdict} simulation gave the verdict")
+    result, _, stats = finished[verdict]
+    if processor.stats is not None:
+        processor.stats.tasks.update(stats.tasks)
+    return result
+
+def process_processor(processor: 'Processor', policy: SchedulingPolicy, allow_simulation: bool = True) -> NewBool:
+    # the preprocessors rescale copies, the partition may be reused by the caller
+    preprocessor = Preprocessor(processor.task_set, policy.name)
+    # sychronize the taskset first, if the synchronous passed, asynchronous also pass
+    synchronous_preprocessor = Preprocessor(processor.task_set.synchronize_self(), policy.name)
+    preprocess_result, synchronous_preprocess_result = preprocess_processor(
+        processor, preprocessor, synchronous_preprocessor, policy)
+
+    if preprocess_result == NewBool.TRUE:
+        return NewBool.TRUE
+    if preprocess_result == NewBool.FALSE:
+        return NewBool.FALSE
+
+    # simulation, the synchronous one only if its preprocess could not tell
+    processor.need_simulation = True
+    if not allow_simulation:
+        return NewBool.CANNOT_TELL
+    simulate_synchronous = synchronous_preprocess_result == NewBool.CANNOT_TELL
+    if processor.portfolio and simulate_synchronous:
+        return simulate_processor_portfolio(processor, preprocessor, synchronous_preprocessor, policy)
+    simulation_result = simulate_processor(processor, preprocessor, synchronous_preprocessor, policy,
+                                           simulate_synchronous=simulate_synchronous)
+    return simulation_result
+
+def process_cluster(cluster: 'Processor', allow_simulation: bool = True) -> NewBool:
+    """
+    Check the tasks of a cluster with global EDF on its capacity cores, like run_global
+    """
+    preprocessor = Preprocessor(cluster.task_set, "edf")
+    is_feasible, need_simulation = preprocessor.preprocess_global_edf(cluster.task_set, cluster.capacity)
+    if is_feasible:
+        return NewBool.TRUE
+    if not need_simulation:
+        return NewBool.FALSE
+
+    cluster.need_simulation = True
+    if not allow_simulation:
+        return NewBool.CANNOT_TELL
+    from .simulation_functions import schedule_global_edf
+    schedulePassed = schedule_global_edf(preprocessor.task_set, preprocessor.feasibility_interval, preprocessor.simulator_timestep,
+                                         cluster.capacity, cluster.stats, cluster.miss_handling, processor=cluster)
+    if schedulePassed == NewBool.CANNOT_TELL:
+        # stopped by another cluster, or the time budget of miss_handling ran out
+        return NewBool.CANNOT_TELL
+    return NewBool.TRUE if schedulePassed else NewBool.FALSE
+
+def check_partitioned(processor_list: List['Processor'], num_workers: int, verdict_cache: dict = None,
+                      policy: str = "edf", allow_simulation: bool = True, clustered: bool = False):
+    """
+    Check every processor of a partition with the scheduling policy (EDF by default), in parallel, stop early on the first failure.
+    With clustered, each processor is a cluster of processor.capacity cores checked with global EDF, see process_cluster.
+    verdict_cache maps the policy and the task ids of a processor to its verdict, need_simulation and the statistics
+    of its tasks (None if the processor had no stats), it lets a caller probing several partitions skip the processors
+    already checked. A hit adds the cached statistics to processor.stats, an entry without them is checked again if stats are wanted.
+    Returns is_feasible, need_simulation and cannot_tell,
+    or None if allow_simulation is False and the preprocessors could not decide without a simulation
+    """
+    import concurrent.futures
+    from . import myglobal
+    myglobal.global_stop_flag.clear()
+    policy = get_policy(policy)
+
+    def check_processor(processor: 'Processor') -> NewBool:
+        if clustered:
+            return process_cluster(processor, allow_simulation)
+        return process_processor(processor, policy, allow_simulation)
+
+    def process_processor_cached(processor: 'Processor') -> NewBool:
+        if verdict_cache is None:
+            return check_processor(processor)
+        key = (policy.name, processor.capacity if clustered else 1, frozenset(task.task_id for task in processor.task_set.tasks))
+        if key in verdict_cache:
+            result, need_simulation, task_stats = verdict_cache[key]
+            if processor.stats is None or task_stats is not None:
+                processor.need_simulation = need_simulation
+                if processor.stats is not None:
+                    processor.stats.tasks.update((task_id, dataclasses.replace(stats)) for task_id, stats in task_stats.items())
+                return result
+        result = check_processor(processor)
+        if result != NewBool.CANNOT_TELL:
+            # CANNOT_TELL only comes from a stop by another processor, it is not a verdict of this subset
+            task_stats = None
+            if processor.stats is not None:
+                task_stats = {task.task_id: dataclasses.replace(processor.stats.tasks[task.task_id])
+                              for task in processor.task_set.tasks if task.task_id in processor.stats.tasks}
+            verdict_cache[key] = (result, processor.need_simulation, task_stats)
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(process_processor_cached, processor) for processor in processor_list]
+        results = []
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                if isinstance(result, NewBool):
+                    results.append(result)
+                    if result == NewBool.FALSE:
+                        myglobal.global_stop_flag.set()
+                else:
+                    raise ValueError(f"Unexpected result: {result}")
+        except Exception as e:
+            print(f"Error occurred: {e}")
+        finally:
+            for future in futures:
+                future.cancel()
+
+    # Aggregate results
+    cannot_tell = False
+    if not allow_simulation and NewBool.FALSE not in results and NewBool.CANNOT_TELL in results:
+        return None
+    if NewBool.FALSE in results:
+        # if there exists NewBool.FALSE in results, is_feasible is False
+        is_feasible = False
+    elif NewBool.CANNOT_TELL in results:
+        # if there exists NewBool.CANNOT_TELL in results, cannot_tell is True
+        is_feasible = False
+        cannot_tell = True
+    elif all(result == NewBool.TRUE for result in results):
+        # if results full with NewBool.TRUE, is_feasible is True
+        is_feasible = True
+    else:
+        # raise error illegal value
+        raise ValueError(f"Unexpected result: {results}")
+
+    need_simulation = any(processor.need_simulation for processor in processor_list)
+    return is_feasible, need_simulation, cannot_tell
+
+def run_partitioned(task_set: TaskSet, num_cores: int, heuristic: str, ordering: str, num_workers: int,
+                    policy: str = "edf", allow_simulation: bool = True, stats: SimulationStats = None,
+                    miss_handling: MissHandling = None, portfolio: bool = False, verdict_cache: dict = None,
+                    repair_budget: float = None, bb_timeout: float = 10.0):
+    from .partitioner import Processor, Partitioner
+    processor_list = [Processor(i) for i in range(num_cores)]
+    for processor in processor_list:
+        # a task is on one processor only, the processors fill distinct entries
+        processor.stats = stats
+        processor.miss_handling = miss_handling
+        processor.portfolio = portfolio
+    partitioner = Partitioner(task_set, processor_list, ordering, policy, repair_budget, bb_timeout)
+    partition_is_possible = partitioner.partition(PARTITION_METHODS[heuristic])
+
+    if not partition_is_possible:
+        # cannot tell if the branch and bound gave up, or found no partition of an asynchronous taskset
+        return False, False, partitioner.cannot_tell
+    return check_partitioned(processor_list, num_workers, verdict_cache, policy, allow_simulation)
+
+def partition_combination(arguments: tuple):
+    """
+    Run in a worker process of run_partitioned_auto: partition and check the taskset with one heuristic and ordering.
+    Returns the heuristic, the ordering, the verdict of run_partitioned and the statistics of its simulations
+    """
+    import contextlib
+    import io
+    (task_set, num_cores, heuristic, ordering, policy, allow_simulation, with_stats, miss_handling, repair_budget,
+     verdict_cache) = arguments
+    stats = SimulationStats() if with_stats else None
+    # the partitioners of all the combinations would print at the same time
+    with contextlib.redirect_stdout(io.StringIO()):
+        # the pool already uses the cores, check the processors one after the other
+        verdict = run_partitioned(task_set, num_cores, heuristic, ordering, 1, policy, allow_simulation, stats,
+                                  miss_handling, verdict_cache=verdict_cache, repair_budget=repair_budget)
+    return heuristic, ordering, verdict, stats
+
+def run_partitioned_auto(task_set: TaskSet, num_cores: int, orderings: List[str], num_workers: int, policy: str = "edf",
+                         allow_simulation: bool = True, stats: SimulationStats = None, miss_handling: MissHandling = None,
+                         repair_budget: float = None):
+    """
+    Partition and check the taskset with every heuristic and each of the orderings at the same time in a process pool,
+    the runs share the verdicts of the subsets of tasks already checked on a core.
+    The pool is stopped as soon as one partition passes the checks of every core.
+    Returns the heuristic and ordering of that partition (None if there is none),
+    and is_feasible, need_simulation and cannot_tell (None if allow_simulation is False and a run could not decide)
+    """
+    import multiprocessing
+    combinations = [(heuristic, ordering) for heuristic in GREEDY_HEURISTICS for ordering in orderings]
+    results = {}
+    with multiprocessing.Manager() as manager:
+        verdict_cache = manager.dict()
+        arguments = [(task_set, num_cores, heuristic, ordering, policy, allow_simulation, stats is not None, miss_handling,
+                      repair_budget, verdict_cache) for heuristic, ordering in combinations]
+        # leaving the pool terminates the runs still going on
+        with multiprocessing.Pool(max(1, min(num_workers, len(combinations)))) as pool:
+            for heuristic, ordering, verdict, combination_stats in pool.imap_unordered(partition_combination, arguments):
+                if verdict is not None and verdict[0]:
+                    if stats is not None:
+                        stats.tasks.update(combination_stats.tasks)
+                    return (heuristic, ordering), verdict
+                results[(heuristic, ordering)] = (verdict, combination_stats)
+
+    if not allow_simulation and any(verdict is None for verdict, _ in results.values()):
+        return None, None
+    if stats is not None:
+        # no partition passes, keep the statistics of the first combination that simulated
+        for combination in combinations:
+            if results[combination][1].tasks:
+                stats.tasks.update(results[combination][1].tasks)
+                break
+    need_simulation = any(verdict[1] for verdict, _ in results.values())
+    cannot_tell = any(verdict[2] for verdict, _ in results.values())
+    return None, (False, need_simulation, cannot_tell)
+
+def run_semi_partitioned(task_set: TaskSet, num_cores: int, ordering: str, num_workers: int, allow_simulation: bool = True,
+                         stats: SimulationStats = None, miss_handling: MissHandling = None):
+    """
+    Semi-partitioned EDF: the tasks are placed by first fit in the ordering (decreasing utilization by default),
+    a task that fits on no processor is split over several processors with C=D splitting, see Partitioner.split.
+    Each processor is then checked with its pieces like a processor of partitioned EDF
+    """
+    from .partitioner import Processor, Partitioner
+    processor_list = [Processor(i) for i in range(num_cores)]
+    for processor in processor_list:
+        processor.stats = stats
+        processor.miss_handling = miss_handling
+    partitioner = Partitioner(task_set, processor_list, ordering or "du", "edf")
+    if not partitioner.partition("semi_partition"):
+        return False, False, False
+    for task_id, piece_ids in partitioner.split_tasks.items():
+        pieces = [f"{piece.name} (id {piece.task_id}, C = {piece.computation_time}, D = {piece.deadline}, "
+                  f"O = {piece.offset}) on Processor{processor.processor_id}"
+                  for piece_id in piece_ids for processor in processor_list
+                  for piece in processor.task_set.tasks if piece.task_id == piece_id]
+        print(f"semi: Task_{task_id} split into {', '.join(pieces)}")
+    return check_partitioned(processor_list, num_workers, allow_simulation=allow_simulation)
+
+def run_clustered(task_set: TaskSet, num_cores: int, cluster_size: int, heuristic: str, ordering: str, num_workers: int,
+                  allow_simulation: bool = True, stats: SimulationStats = None, miss_handling: MissHandling = None):
+    """
+    Clustered EDF: the cores are grouped in clusters of cluster_size cores, the tasks are partitioned over the clusters
+    with the heuristic (the capacity of a cluster is its number of cores) and each cluster runs global EDF.
+    The clusters are checked in parallel like the processors of partitioned EDF, stop early on the first failure
+    """
+    if num_cores % cluster_size != 0:
+        raise ValueError(f"the cluster size {cluster_size} must divide the number of cores {num_cores}")
+    from .partitioner import Processor, Partitioner
+    cluster_list = [Processor(i) for i in range(num_cores // cluster_size)]
+    for cluster in cluster_list:
+        cluster.capacity = cluster_size
+        cluster.stats = stats
+        cluster.miss_handling = miss_handling
+    partitioner = Partitioner(task_set, cluster_list, ordering, "edf")
+    if not partitioner.partition(PARTITION_METHODS[heuristic]):
+        return False, False, False
+    return check_partitioned(cluster_list, num_workers, allow_simulation=allow_simulation, clustered=True)
+
+def run_global(task_set: TaskSet, num_cores: int, allow_simulation: bool = True, stats: SimulationStats = None,
+               miss_handling: MissHandling = None):
+    preprocessor = Preprocessor(task_set, "edf")
+    is_feasible, need_simulation = preprocessor.preprocess_global_edf(task_set, num_cores)
+    if not is_feasible and miss_handling is not None:
+        # simulate a rejected taskset anyway, to measure the overload
+        need_simulation = True
+    if not is_feasible and need_simulation:
+        if not allow_simulation:
+            return None
+        from .simulation_functions import schedule_global_edf
+        schedulePassed = schedule_global_edf(preprocessor.task_set, preprocessor.feasibility_interval, preprocessor.simulator_timestep,
+                                             num_cores, stats, miss_handling)
+        if schedulePassed == NewBool.CANNOT_TELL:
+            # the time budget of miss_handling ran out
+            return False, need_simulation, True
+        is_feasible = schedulePassed
+    return is_feasible, need_simulation, False
+
+def run_global_edf_k_auto(task_set: TaskSet, num_cores: int, allow_simulation: bool = True, stats: SimulationStats = None,
+                          miss_handling: MissHandling = None):
+    preprocessor = Preprocessor(task_set, "edf")
+    is_feasible, need_simulation, k_of_edf = preprocessor.preprocess_global_edf_k_auto(task_set, num_cores)
+    print(f"edf(k), chosen k = {k_of_edf}")
+    if not is_feasible and miss_handling is not None:
+        need_simulation = True
+    if not is_feasible and need_simulation:
+        if not allow_simulation:
+            return None
+        # only the chosen k is simulated, the tasks are already sorted by the preprocessor
+        from .simulation_functions import schedule_global_edf_k
+        schedulePassed = schedule_global_edf_k(preprocessor.task_set, preprocessor.feasibility_interval, preprocessor.simulator_timestep,
+                                               k_of_edf, num_cores, presorted=True, stats=stats, miss_handling=miss_handling)
+        if schedulePassed == NewBool.CANNOT_TELL:
+            return False, need_simulation, True
+        is_feasible = schedulePassed
+    return is_feasible, need_simulation, False
+
+def run_global_edf_k(task_set: TaskSet, num_cores: int, k_of_edf: int, allow_simulation: bool = True,
+                     stats: SimulationStats = None, miss_handling: MissHandling = None):
+    preprocessor = Preprocessor(task_set, "edf")
+    is_feasible, need_simulation = preprocessor.preprocess_global_edf_k(task_set, num_cores, k_of_edf)
+    if not is_feasible and miss_handling is not None:
+        need_simulation = True
+    if not is_feasible and need_simulation:
+        if not allow_simulation:
+            return None
+        from .simulation_functions import schedule_global_edf_k
+        schedulePassed = schedule_global_edf_k(preprocessor.task_set, preprocessor.feasibility_interval, preprocessor.simulator_timestep,
+                                               k_of_edf, num_cores, presorted=True, stats=stats, miss_handling=miss_handling)
+        if schedulePassed == NewBool.CANNOT_TELL:
+            return False, need_simulation, True
+        is_feasible = schedulePassed
+    return is_feasible, need_simulation, False
+
+def run(task_set: TaskSet, num_cores: int, scheduling_algorithm, heuristic: str = None, ordering: str = None, num_workers: int = None,
+        policy: str = "edf", allow_simulation: bool = True, stats: SimulationStats = None,
+        miss_handling: MissHandling = None, portfolio: bool = False, repair_budget: float = None, bb_timeout: float = 10.0,
+        cluster_size: int = None):
+    """
+    Check the taskset with the given version of EDF ('partitioned', 'semi', 'clustered', 'global', 'edfk-auto' or k of EDF^(k)),
+    returns is_feasible, need_simulation and cannot_tell
+    policy is the scheduling policy of each core in partitioned mode.
+    'clustered' partitions the tasks with the heuristic and ordering over clusters of cluster_size cores, see run_clustered.
+    With allow_simulation False only the analytical checks run, None is returned if they cannot decide.
+    stats is filled by the simulations if some run, the verdict and the statistics come from the same run.
+    The simulations stop at the first deadline miss, or go on as miss_handling says if it is given.
+    With portfolio, the synchronous and asynchronous simulations of a processor run at the same time (partitioned only).
+    The heuristic 'auto' tries every heuristic with the ordering (every ordering if it is None), see run_partitioned_auto.
+    With repair_budget, a partition the heuristic fails is repaired by a local search of up to that many seconds,
+    see Partitioner.repair. The heuristic 'bb' searches every partition for up to bb_timeout seconds, see Partitioner.branch_and_bound
+    """
+    if scheduling_algorithm == "partitioned" and heuristic == "auto":
+        orderings = [ordering] if ordering is not None else list(PARTITION_ORDERINGS)
+        combination, verdict = run_partitioned_auto(task_set, num_cores, orderings, num_workers, policy, allow_simulation,
+                                                    stats, miss_handling, repair_budget)
+        if combination is not None:
+            print(f"partitioned auto: {combination[0]}-{combination[1]} gives a schedulable partition")
+        elif verdict is not None:
+            print("partitioned auto: no heuristic and ordering gives a schedulable partition")
+        return verdict
+    elif scheduling_algorithm == "partitioned":
+        return run_partitioned(task_set, num_cores, heuristic, ordering, num_workers, policy, allow_simulation, stats,
+                               miss_handling, portfolio, repair_budget=repair_budget, bb_timeout=bb_timeout)
+    elif scheduling_algorithm == "semi":
+        return run_semi_partitioned(task_set, num_cores, ordering, num_workers, allow_simulation, stats, miss_handling)
+    elif scheduling_algorithm == "clustered":
+        return run_clustered(task_set, num_cores, cluster_size, heuristic, ordering, num_workers, allow_simulation, stats,
+                             miss_handling)
+    elif scheduling_algorithm == "global":
+        return run_global(task_set, num_cores, allow_simulation, stats, miss_handling)
+    elif scheduling_algorithm == "edfk-auto":
+        return run_global_edf_k_auto(task_set, num_cores, allow_simulation, stats, miss_handling)
+    else:
+        return run_global_edf_k(task_set, num_cores, int(scheduling_algorithm), allow_simulation, stats, miss_handling)
+
+def exit_code(is_feasible: bool, need_simulation: bool, cannot_tell: bool) -> int:
+    if cannot_tell and not is_feasible:
+        # e.g. the time budget of a simulation ran out
+        return 4
+    if is_feasible and need_simulation:
+        return 0
+    elif is_feasible and not need_simulation:
+        return 1
+    elif not is_feasible and need_simulation:
+        return 2
+    elif not is_feasible and not need_simulation:
+        if cannot_tell:
+            return 4
+        return 3
+    else:
+        raise ValueError(f"is_feasible and need_simulation must be set to True or False. Currently: is_feasible = {is_feasible}, need_simulation = {need_simulation}")
+
+
+def min_cores_lower_bound(task_set: TaskSet) -> int:
+    # at least ceil(U) cores, and at least one
+    return max(1, help_functions.ceil(sum(task.utilization for task in task_set.tasks)))
+
+def find_min_cores_partitioned(task_set: TaskSet, max_cores: int, heuristic: str, ordering: str,
+                               num_workers: int, verdict_cache: dict, policy: str = "edf", repair_budget: float = None,
+                               bb_timeout: float = 10.0) -> int:
+    """
+    Linear search of the smallest number of cores for a partitioned heuristic, from ceil(U) to max_cores.
+    The partitioner keeps its partial partition when a task does not fit and resumes it with one more core,
+    and verdict_cache keeps the verdict of every subset of tasks already checked on a core.
+    Returns None if no number of cores up to max_cores works
+    """
+    from .partitioner import Processor, Partitioner
+    num_cores = min_cores_lower_bound(task_set)
+    if num_cores > max_cores:
+        return None
+    processor_list = [Processor(i) for i in range(num_cores)]
+    partitioner = Partitioner(task_set, processor_list, ordering, policy, repair_budget, bb_timeout)
+    while True:
+        if partitioner.partition(PARTITION_METHODS[heuristic]):
+            for processor in processor_list:
+                processor.need_simulation = False
+            is_feasible, _, _ = check_partitioned(processor_list, num_workers, verdict_cache, policy)
+            if is_feasible:
+                return num_cores
+            if partitioner.is_resumable():
+                # all tasks are placed, more cores would give the same partition
+                return None
+        if num_cores == max_cores:
+            return None
+        partitioner.add_processor(Processor(num_cores))
+        num_cores += 1
+
+def find_min_cores_global(task_set: TaskSet, max_cores: int, scheduling_algorithm) -> int:
+    """
+    Linear search of the smallest number of cores for global EDF, EDF^k or semi-partitioned EDF, from ceil(U) to max_cores.
+    Returns None if no number of cores up to max_cores works
+    """
+    for num_cores in range(min_cores_lower_bound(task_set), max_cores + 1):
+        is_feasible, _, _ = run(task_set, num_cores, scheduling_algorithm)
+        if is_feasible:
+            return num_cores
+    return None
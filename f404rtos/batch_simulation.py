@@ -0,0 +1,86 @@
+from .datatypes import *
+from typing import List
+import numpy as np
+
+# larger than any deadline or release time of a simulation
+NO_JOB = np.iinfo(np.int64).max
+
+
+def schedule_edf_batch(task_sets: List[TaskSet], time_maxes: List[int], time_steps: List[int]) -> List[NewBool]:
+    """
+    Simulate EDF on many small tasksets at once, advancing them in lockstep: the k-th step of every taskset runs together.
+    Each taskset gets the verdict schedule(task_set, "edf", time_max, time_step) would give, it is retired
+    as soon as it has one (first deadline miss, idle point of a synchronous taskset, or end of time_max).
+    The tasks of each taskset are a row of (K, n_max) arrays. Like PendingJobs, a task keeps its oldest pending job
+    (release time and remaining work) and the number of its pending jobs, the others are released every period after it.
+    time_step must divide the offsets and periods, as the one of Preprocessor.set_simulator_timestep does
+    """
+    num_task_sets = len(task_sets)
+    num_tasks = max([len(task_set.tasks) for task_set in task_sets] + [1])
+    offsets = np.zeros((num_task_sets, num_tasks), dtype=np.int64)
+    computation_times = np.zeros((num_task_sets, num_tasks), dtype=np.int64)
+    deadlines = np.zeros((num_task_sets, num_tasks), dtype=np.int64)
+    # the padding tasks never release a job
+    periods = np.ones((num_task_sets, num_tasks), dtype=np.int64)
+    valid = np.zeros((num_task_sets, num_tasks), dtype=bool)
+    for row, task_set in enumerate(task_sets):
+        for position, task in enumerate(task_set.tasks):
+            offsets[row, position] = task.offset
+            computation_times[row, position] = task.computation_time
+            deadlines[row, position] = task.deadline
+            periods[row, position] = task.period
+            valid[row, position] = True
+    # a hyperperiod may not fit in 64 bits, the simulation stops long before it anyway
+    time_max = np.array([min(time_max, NO_JOB) for time_max in time_maxes], dtype=np.int64)
+    time_step = np.array(time_steps, dtype=np.int64)
+    synchronous = np.array([task_set.is_synchronous for task_set in task_sets], dtype=bool)
+
+    head_release = np.zeros((num_task_sets, num_tasks), dtype=np.int64)
+    remaining = np.zeros((num_task_sets, num_tasks), dtype=np.int64)
+    pending = np.zeros((num_task_sets, num_tasks), dtype=np.int64)
+    # index of each row in task_sets
+    indices = np.arange(num_task_sets)
+    verdicts = [None] * num_task_sets
+
+    step = 0
+    while indices.size > 0:
+        current_time = step * time_step
+        # end of the simulation, or idle point of a synchronous taskset (Corollary 59)
+        passed = (current_time >= time_max) | (synchronous & (current_time > 0) & (pending == 0).all(axis=1))
+        # release the new jobs, a job becomes the head of its task when the previous jobs are done
+        released = valid & (current_time[:, None] >= offsets) & ((current_time[:, None] - offsets) % periods == 0)
+        new_head = released & (pending == 0)
+        head_release = np.where(new_head, current_time[:, None], head_release)
+        remaining = np.where(new_head, computation_times, remaining)
+        pending = pending + released
+        # the oldest pending job of a task has its earliest deadline
+        busy = pending > 0
+        head_deadline = np.where(busy, head_release + deadlines, NO_JOB)
+        missed = ~passed & (current_time[:, None] >= head_deadline).any(axis=1)
+
+        retired = passed | missed
+        if retired.any():
+            for index, is_passed in zip(indices[retired], passed[retired]):
+                verdicts[index] = NewBool.TRUE if is_passed else NewBool.FALSE
+            kept = ~retired
+            (indices, current_time, time_max, time_step, synchronous, offsets, computation_times, deadlines, periods, valid,
+             head_release, remaining, pending, busy, head_deadline) = (
+                array[kept] for array in (indices, current_time, time_max, time_step, synchronous, offsets, computation_times,
+                                          deadlines, periods, valid, head_release, remaining, pending, busy, head_deadline))
+
+        # the earliest deadline runs, the ties go to the job released first, then to the first task of the taskset
+        earliest = head_deadline.min(axis=1)
+        chosen = np.where(busy & (head_deadline == earliest[:, None]), head_release, NO_JOB).argmin(axis=1)
+        rows = np.flatnonzero(busy.any(axis=1))
+        columns = chosen[rows]
+        remaining[rows, columns] -= time_step[rows]
+        completed = remaining[rows, columns] <= 0
+        rows, columns = rows[completed], columns[completed]
+        pending[rows, columns] -= 1
+        # the next pending job of the task becomes its head
+        more = pending[rows, columns] > 0
+        rows, columns = rows[more], columns[more]
+        head_release[rows, columns] += periods[rows, columns]
+        remaining[rows, columns] = computation_times[rows, columns]
+        step += 1
+    return verdicts
@@ -0,0 +1,346 @@
+# Purpose: Defines the data types Tasks, Job and TaskSet, and the statistics of a simulation
+from typing import Dict, Iterable, List, Tuple
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import cached_property
+import math
+
+@dataclass(frozen=True)
+class Task:
+    task_id: int
+    name: str
+    computation_time: int
+    period: int
+    deadline: int
+    offset: int
+    utilization: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "utilization", self.computation_time / self.period)
+
+    def __str__(self):
+        return "Task: " + self.name + " " + str(self.computation_time) + " " + str(self.period) + " " + str(self.deadline) + " " + str(self.offset) + " " + str(self.utilization)
+
+    def release_job(self, t:int, time_scale: int = 1) -> 'Job':
+        """
+        Return a new job if the task release one at time t
+        time_scale: original time units in one unit of t (see TaskSet.time_scale), the job is named after its original release time
+        """
+        if self.offset > t:
+            return None
+        if (t-self.offset) % self.period == 0:
+            return Job(job_id=self.task_id*1000+t,
+                       name=self.name+"_J"+str(t*time_scale),
+                       task_id=self.task_id,
+                       release_time=t,
+                       computing_time=self.computation_time,
+                       deadline=t + self.deadline,
+                       # the simulators give the priority of the policy, see SchedulingPolicy.task_priorities
+                       priority=0,
+                       task=self)  # pass the task itself here
+        else:
+            return None
+        
+@dataclass
+class Job:
+    """computation_time: the time REMAINS to complete the job """
+    job_id: int
+    name: str
+    task_id: int
+    release_time: int
+    computing_time: int
+    deadline: int
+    priority: int
+    task: Task
+    # the miss of the job was already handled, see MissHandling
+    missed: bool = False
+
+    def deadline_missed(self, t: int) -> bool:
+        """
+        The job still has work at time t, at or after its deadline: it cannot complete by its deadline any more
+        """
+        return t >= self.deadline and self.computing_time > 0
+
+    def schedule(self, duration: int) -> bool:
+        """
+        Schedule the job for the given duration
+        """
+        if self.computing_time <= duration:
+            # job finished
+            self.computing_time = 0
+            return True
+        else:
+            self.computing_time -= duration
+            # job not finished
+            return False 
+
+@dataclass(frozen=True, eq=False)
+class TaskSet:
+    """
+    The tasks and their C, T, D, O never change once a taskset is built, so the properties derived from them
+    are computed on first use and cached, and a taskset can be shared by threads and processes.
+    rescaled(), with_tasks(), synchronize_self() and the sorted views return new tasksets that share the task objects
+    """
+    tasks: Tuple[Task, ...]
+    # number of original time units in one unit of the (rescaled) taskset
+    time_scale: int = 1
+
+    def __post_init__(self):
+        # any iterable of tasks, e.g. the list read from a file
+        object.__setattr__(self, "tasks", tuple(self.tasks))
+
+    def __str__(self):
+        # make a table to list all tasks
+        table = "TaskSet:\n"
+        table += "ID\tName\tC\tT\tD\tO\tU\n"
+        for task in self.tasks:
+            table += f"{task.task_id}\t{task.name}\t{task.computation_time}\t{task.period}\t{task.deadline}\t{task.offset}\t{task.utilization:.3f}\n"
+
+        return table
+
+    @cached_property
+    def utilization(self) -> float:
+        return sum(task.utilization for task in self.tasks)
+
+    @cached_property
+    def max_utilization(self) -> float:
+        return max((task.utilization for task in self.tasks), default=0.0)
+
+    @cached_property
+    def density(self) -> float:
+        return sum(task.computation_time / min(task.deadline, task.period) for task in self.tasks)
+
+    @cached_property
+    def hyperperiod(self) -> int:
+        return math.lcm(*{task.period for task in self.tasks})
+
+    @cached_property
+    def gcd(self) -> int:
+        """
+        Greatest common divisor of C, T, D, O of all tasks
+        """
+        return math.gcd(*(value for task in self.tasks
+                          for value in (task.computation_time, task.period, task.deadline, task.offset)))
+
+    @cached_property
+    def max_offset(self) -> int:
+        return max((task.offset for task in self.tasks), default=0)
+
+    @cached_property
+    def min_offset(self) -> int:
+        return min((task.offset for task in self.tasks), default=0)
+
+    @cached_property
+    def max_deadline(self) -> int:
+        return max((task.deadline for task in self.tasks), default=0)
+
+    @cached_property
+    def is_synchronous(self) -> bool:
+        return all(task.offset == 0 for task in self.tasks)
+
+    @cached_property
+    def deadline_type(self) -> str:
+        """
+        'implicit' (D = T), 'constrained' (D <= T) or 'arbitrary'
+        """
+        if any(task.deadline > task.period for task in self.tasks):
+            return "arbitrary"
+        if any(task.deadline < task.period for task in self.tasks):
+            return "constrained"
+        return "implicit"
+
+    # sorted views, ties keep the order of the taskset
+    @cached_property
+    def by_increasing_utilization(self) -> 'TaskSet':
+        return self.with_tasks(sorted(self.tasks, key=lambda task: task.utilization))
+
+    @cached_property
+    def by_decreasing_utilization(self) -> 'TaskSet':
+        return self.with_tasks(sorted(self.tasks, key=lambda task: task.utilization, reverse=True))
+
+    @cached_property
+    def by_decreasing_density(self) -> 'TaskSet':
+        return self.with_tasks(sorted(self.tasks, key=lambda task: task.computation_time / min(task.deadline, task.period),
+                                      reverse=True))
+
+    @cached_property
+    def by_decreasing_deadline(self) -> 'TaskSet':
+        return self.with_tasks(sorted(self.tasks, key=lambda task: task.deadline, reverse=True))
+
+    @cached_property
+    def by_deadline(self) -> 'TaskSet':
+        return self.with_tasks(sorted(self.tasks, key=lambda task: task.deadline))
+
+    @cached_property
+    def by_period(self) -> 'TaskSet':
+        return self.with_tasks(sorted(self.tasks, key=lambda task: task.period))
+
+    def with_tasks(self, tasks: Iterable[Task]) -> 'TaskSet':
+        """
+        Return a taskset with other tasks in the same time units
+        """
+        return TaskSet(tasks, time_scale=self.time_scale)
+
+    def release_jobs(self, t: int) -> List[Job]:
+        """
+        Return all new jobs release at time t
+        """
+        jobs = []
+        for task in self.tasks:
+            job = task.release_job(t, self.time_scale)
+            if job is not None:
+                jobs.append(job)
+        return jobs
+    
+    def rescaled(self, factor: int) -> 'TaskSet':
+        """
+        Return the taskset with C, T, D, O of all tasks divided by factor.
+        factor must divide all of them, e.g. their greatest common divisor
+        """
+        if factor <= 1:
+            return self
+        return TaskSet([Task(task_id=task.task_id,
+                             name=task.name,
+                             computation_time=task.computation_time // factor,
+                             period=task.period // factor,
+                             deadline=task.deadline // factor,
+                             offset=task.offset // factor) for task in self.tasks],
+                       time_scale=self.time_scale * factor)
+
+    def shifted(self, shift: int) -> 'TaskSet':
+        """
+        Return the taskset with the offsets of all tasks shift earlier,
+        shift must be at most the smallest offset, e.g. min_offset
+        """
+        if shift == 0:
+            return self
+        return self.with_tasks(Task(task_id=task.task_id,
+                                    name=task.name,
+                                    computation_time=task.computation_time,
+                                    period=task.period,
+                                    deadline=task.deadline,
+                                    offset=task.offset - shift) for task in self.tasks)
+
+    def to_original_time(self, t: int) -> int:
+        """
+        Map a time of the rescaled taskset back to the original time units, for reporting
+        """
+        return t * self.time_scale
+
+    def copy(self) -> 'TaskSet':
+        """
+        return a copy of the taskset, the tasks are immutable so they are shared
+        """
+        return self.with_tasks(self.tasks)
+
+    def synchronize_self(self)->'TaskSet':
+        """
+        return a copy of the taskset with all tasks synchronized, offset set to 0
+        """
+        # make a copy of the taskset
+        return TaskSet([Task(task_id=task.task_id,
+                        name=task.name,
+                        computation_time=task.computation_time,
+                        period=task.period,
+                        deadline=task.deadline,
+                        offset=0) for task in self.tasks],
+                       time_scale=self.time_scale)
+
+@dataclass
+class TaskStats:
+    """Statistics of the jobs of one task in a simulation, in the original time units"""
+    # number of jobs that completed
+    jobs: int = 0
+    worst_response_time: int = 0
+    total_response_time: int = 0
+    # smallest deadline - completion time, the largest lateness is -min_slack
+    min_slack: int = None
+    # times a job of the task was stopped by another job before it completed
+    preemptions: int = 0
+    # times a job of the task resumed on another core than the one it last ran on (global simulators)
+    migrations: int = 0
+    # deadline misses and the largest tardiness of the late jobs, the simulation only goes on after a miss with MissHandling
+    misses: int = 0
+    max_tardiness: int = 0
+
+    @property
+    def average_response_time(self) -> float:
+        return self.total_response_time / self.jobs if self.jobs > 0 else 0.0
+
+@dataclass
+class SimulationStats:
+    """
+    Per task statistics filled by the simulators when one is given, task_id -> TaskStats.
+    Only sums and extremes are kept, the memory does not grow with the number of jobs
+    """
+    tasks: Dict[int, TaskStats] = field(default_factory=dict)
+
+    def task(self, task_id: int) -> TaskStats:
+        if task_id not in self.tasks:
+            self.tasks[task_id] = TaskStats()
+        return self.tasks[task_id]
+
+    def job_completed(self, task_id: int, response_time: int, slack: int) -> None:
+        task_stats = self.task(task_id)
+        task_stats.jobs += 1
+        task_stats.total_response_time += response_time
+        task_stats.worst_response_time = max(task_stats.worst_response_time, response_time)
+        if task_stats.min_slack is None or slack < task_stats.min_slack:
+            task_stats.min_slack = slack
+
+    def job_late(self, task_id: int, tardiness: int) -> None:
+        task_stats = self.task(task_id)
+        task_stats.max_tardiness = max(task_stats.max_tardiness, tardiness)
+
+    def clear(self) -> None:
+        self.tasks.clear()
+
+    def __str__(self):
+        table = "SimulationStats:\n"
+        table += "ID\tJobs\tWorstR\tAvgR\tMinSlack\tPreempt\tMigr\tMisses\tMaxTard\n"
+        for task_id in sorted(self.tasks):
+            task_stats = self.tasks[task_id]
+            table += (f"{task_id}\t{task_stats.jobs}\t{task_stats.worst_response_time}\t{task_stats.average_response_time:.2f}\t"
+                      f"{task_stats.min_slack}\t{task_stats.preemptions}\t{task_stats.migrations}\t"
+                      f"{task_stats.misses}\t{task_stats.max_tardiness}\n")
+        return table
+
+MISS_POLICIES = ["abort", "skip"]
+
+@dataclass
+class MissHandling:
+    """
+    Go on simulating after a deadline miss instead of stopping at the first one.
+    policy: 'abort' drops the late job, its tardiness is the time it was dropped after its deadline,
+            'skip' skips the miss and lets the late job complete, its tardiness is measured at its completion.
+    The simulation still stops after max_misses misses, or after time_budget seconds
+    (the verdict is then FALSE if a deadline was missed, CANNOT_TELL otherwise)
+    """
+    policy: str = "abort"
+    max_misses: int = None
+    time_budget: float = None
+
+    def __post_init__(self):
+        if self.policy not in MISS_POLICIES:
+            raise ValueError(f"Unknown miss policy {self.policy}, choose from {', '.join(MISS_POLICIES)}")
+
+class NewBool(Enum):
+    TRUE = 1
+    FALSE = 0
+    CANNOT_TELL = -1
+
+    def __bool__(self):
+        if self == NewBool.CANNOT_TELL:
+            raise ValueError("Cannot convert CANNOT_TELL to bool")
+        return self.value == 1
+
+    def __str__(self):
+        return self.name.lower()
+    
+    def from_bool(b: bool):
+        if b:
+            return NewBool.TRUE
+        elif not b:
+            return NewBool.FALSE
+        else:
+            return None
@@ -0,0 +1,151 @@
+# Purpose: Polynomial time sufficient schedulability tests for global EDF on m identical cores
+# All tests hold for sporadic tasks, so they also hold for periodic tasks with any offsets
+from .datatypes import *
+from typing import List
+from . import help_functions
+
+
+def _is_constrained(tasks: List[Task]) -> bool:
+    return all(task.deadline <= task.period for task in tasks)
+
+def _carried_jobs(task: Task, window: int) -> int:
+    """
+    Number of jobs of task with their release and deadline inside a window of length window
+    ending at a deadline of the task under analysis
+    """
+    return (window - task.deadline) // task.period + 1
+
+def _edf_workload(task: Task, window: int, slack: int = 0) -> int:
+    """
+    Upper bound of the work of task that can interfere in a window of length window under EDF:
+    the jobs fully inside the window plus the carry-in job, that ends at least slack before its deadline
+    """
+    n_jobs = _carried_jobs(task, window)
+    return n_jobs * task.computation_time + min(task.computation_time, max(0, window - n_jobs * task.period - slack))
+
+def _generic_workload(task: Task, window: int, slack: int = 0) -> int:
+    """
+    Upper bound of the work of task in any window of length window, for any work-conserving algorithm
+    (Bertogna and Cirinei, 2007)
+    """
+    n_jobs = (window + task.deadline - task.computation_time - slack) // task.period
+    return n_jobs * task.computation_time + min(task.computation_time,
+                                                window + task.deadline - task.computation_time - slack - n_jobs * task.period)
+
+
+def gfb_test(tasks: List[Task], num_cores: int) -> bool:
+    """
+    GFB test (Goossens, Funk and Baruah), with densities C / min(D, T) so it also holds for
+    constrained and arbitrary deadlines: sum of densities <= m - (m - 1) * max density
+    """
+    densities = [task.computation_time / min(task.deadline, task.period) for task in tasks]
+    max_density = max(densities)
+    if help_functions.is_greater(max_density, 1):
+        return False
+    return help_functions.is_smaller_or_equal(sum(densities), num_cores - (num_cores - 1) * max_density)
+
+def bak_test(tasks: List[Task], num_cores: int) -> bool:
+    """
+    BAK test (Baker), constrained deadlines only.
+    For each task k with density l_k = C_k / D_k: sum_i min(1, beta_i) <= m * (1 - l_k) + l_k
+    """
+    if not _is_constrained(tasks):
+        return False
+    for task_k in tasks:
+        density_k = task_k.computation_time / task_k.deadline
+        if help_functions.is_greater(density_k, 1):
+            return False
+        beta_sum = 0.0
+        for task_i in tasks:
+            beta = task_i.utilization * (1 + (task_i.period - task_i.deadline) / task_k.deadline)
+            if help_functions.is_smaller(density_k, task_i.utilization):
+                beta += (task_i.computation_time - density_k * task_i.period) / task_k.deadline
+            beta_sum += min(1, beta)
+        if help_functions.is_greater(beta_sum, num_cores * (1 - density_k) + density_k):
+            return False
+    return True
+
+def bcl_test(tasks: List[Task], num_cores: int) -> bool:
+    """
+    BCL test (Bertogna, Cirinei and Lipari), constrained deadlines only.
+    The interference on each task k in its deadline window is bounded by the EDF workload of the other tasks,
+    the test is done in integers, multiplied by D_k
+    """
+    if not _is_constrained(tasks):
+        return False
+    for k, task_k in enumerate(tasks):
+        laxity = task_k.deadline - task_k.computation_time
+        if laxity < 0:
+            return False
+        interference = 0
+        has_small_interferer = False
+        for i, task_i in enumerate(tasks):
+            if i == k:
+                continue
+            workload = _edf_workload(task_i, task_k.deadline)
+            interference += min(workload, laxity)
+            if 0 < workload <= laxity:
+                has_small_interferer = True
+        if interference > num_cores * laxity:
+            return False
+        if interference == num_cores * laxity and not has_small_interferer:
+            return False
+    return True
+
+def rta_test(tasks: List[Task], num_cores: int, max_rounds: int = 100) -> bool:
+    """
+    Response time analysis for global EDF (Bertogna and Cirinei, 2007), constrained deadlines only.
+    The response time bound of each task is iterated to a fixed point, using the slacks D_i - R_i found so far
+    to tighten the carry-in of the other tasks. The rounds go on while some slack is improved
+    """
+    if not _is_constrained(tasks):
+        return False
+    slacks = [0] * len(tasks)
+    verified = [False] * len(tasks)
+    for _ in range(max_rounds):
+        updated = False
+        for k, task_k in enumerate(tasks):
+            response_time = task_k.computation_time
+            while response_time <= task_k.deadline:
+                interference = 0
+                for i, task_i in enumerate(tasks):
+                    if i == k:
+                        continue
+                    workload = min(_generic_workload(task_i, response_time, slacks[i]),
+                                   _edf_workload(task_i, task_k.deadline, slacks[i]))
+                    interference += min(workload, response_time - task_k.computation_time + 1)
+                next_response_time = task_k.computation_time + interference // num_cores
+                if next_response_time == response_time:
+                    break
+                response_time = next_response_time
+
+            if response_time <= task_k.deadline:
+                verified[k] = True
+                if task_k.deadline - response_time > slacks[k]:
+                    slacks[k] = task_k.deadline - response_time
+                    updated = True
+            else:
+                verified[k] = False
+        if not updated:
+            break
+    return all(verified)
+
+
+# tests in the order they are tried, the cheapest first
+GLOBAL_EDF_TESTS = {
+    "GFB": gfb_test,
+    "BAK": bak_test,
+    "BCL": bcl_test,
+    "RTA": rta_test,
+}
+
+def find_passing_test(tasks: List[Task], num_cores: int) -> str:
+    """
+    Return the name of the first sufficient test proving the tasks schedulable with global EDF, None if no test does
+    """
+    if len(tasks) == 0:
+        return None
+    for name, test in GLOBAL_EDF_TESTS.items():
+        if test(tasks, num_cores):
+            return name
+    return None
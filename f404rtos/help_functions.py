@@ -14,3 +14,10 @@ def is_smaller(a, b, epsilon = 1e-15):
 
 def is_equal(a, b, epsilon = 1e-15):
     return a == b or math.isclose(a, b, abs_tol=epsilon)
+
+
+def ceil(a, epsilon = 1e-15):
+    # ceil that ignores floating point noise, e.g. 2.0000000000000004 -> 2
+    if is_equal(a, round(a), epsilon):
+        return round(a)
+    return math.ceil(a)
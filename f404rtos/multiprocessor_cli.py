@@ -0,0 +1,125 @@
+# Purpose: Command line interface of the multiprocessor analyses, see Project2/src/main.py
+import argparse
+import os
+
+from .analysis import *
+from .scheduling_functions import SCHEDULING_POLICIES
+
+def parseArgs():
+    """
+    parse command line arguments
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("file", help="Task file")
+    parser.add_argument("m", type=int, help="Number of cores to allocate (upper bound of the search with --min-cores)")
+    parser.add_argument("-v", required=True, help="Version of EDF to use ('global', 'partitioned', 'semi' (semi-partitioned, with task splitting), "
+                                                  "'clustered' (global EDF in clusters of -c cores), "
+                                                  "<k> (for EDF^k), or 'edfk-auto' (EDF^k with the best k))")
+    parser.add_argument("-c", type=int, help="Number of cores of a cluster for 'clustered', it must divide m")
+    parser.add_argument("-w", type=int, help="Number of workers (default: # of cpu cores on the machine)")
+    parser.add_argument("-h", help="Heuristic for partitioned EDF, 'auto' tries them all in parallel and keeps the first that works, "
+                                   "'bb' (branch and bound) searches every partition",
+                        choices=list(PARTITION_METHODS) + ["auto"])
+    parser.add_argument("-s", help="Ordering of tasks for partitioned EDF: increasing or decreasing utilization, "
+                                   "decreasing density or decreasing deadline (every ordering with -h auto by default, "
+                                   "-h bb always uses decreasing utilization)",
+                        choices=list(PARTITION_ORDERINGS))
+    parser.add_argument("-p", default="edf", choices=list(SCHEDULING_POLICIES),
+                        help="Scheduling policy on each core for partitioned mode (default: edf)")
+    parser.add_argument("--min-cores", action="store_true",
+                        help="Search the smallest number of cores (up to m) for which the taskset is schedulable. "
+                             "With 'partitioned', every heuristic and ordering is searched unless -h and -s are given")
+    parser.add_argument("--repair", type=float, nargs="?", const=1.0, metavar="SECONDS",
+                        help="With 'partitioned', when the heuristic finds no processor for a task, search moves and swaps of tasks "
+                             "between processors that make room for it, for up to SECONDS seconds (default: 1)")
+    parser.add_argument("--bb-timeout", type=float, default=10.0,
+                        help="Seconds before -h bb gives up and prints the partial partition that placed the most tasks (default: 10)")
+    parser.add_argument("--portfolio", action="store_true",
+                        help="With 'partitioned', run the synchronous and asynchronous simulations of a processor in parallel "
+                             "processes and keep the first conclusive verdict")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print the response times, slacks, preemptions and migrations of each task observed by the simulations")
+    parser.add_argument("--misses", choices=MISS_POLICIES,
+                        help="Go on simulating after a deadline miss, 'abort' drops the late job, 'skip' lets it complete late, "
+                             "and print the misses and the largest tardiness of each task (implies --stats)")
+    parser.add_argument("--max-misses", type=int, help="With --misses, stop the simulation after this number of misses")
+    parser.add_argument("--time-budget", type=float, help="With --misses, stop the simulation after this number of seconds")
+
+    args = parser.parse_args()
+
+    if args.v == "partitioned":
+        if (args.h is None or (args.s is None and args.h not in ["auto", "bb"])) and not args.min_cores:
+            parser.error("When 'partitioned' is selected, -h (heuristic) and -s (ordering, optional with -h auto and -h bb) must be provided")
+    elif args.v == "clustered":
+        if args.c is None or args.h not in GREEDY_HEURISTICS or args.s is None:
+            parser.error(f"When 'clustered' is selected, -c (cluster size), -h ({', '.join(GREEDY_HEURISTICS)}) "
+                         "and -s (ordering) must be provided")
+        if args.c < 1 or args.m % args.c != 0:
+            parser.error(f"-c must be a positive divisor of m ({args.m})")
+        if args.min_cores:
+            parser.error("--min-cores is not available with 'clustered'")
+    elif args.v in ["global", "edfk-auto", "semi"]:
+        pass
+    else:
+        try:
+            args.v = int(args.v)
+        except ValueError:
+            parser.error("-v must be 'global', 'partitioned', 'semi', 'clustered', 'edfk-auto', or an integer value for EDF^k")
+    if (args.max_misses is not None or args.time_budget is not None) and args.misses is None:
+        parser.error("--max-misses and --time-budget go with --misses")
+    return args
+
+
+def main():
+    args = parseArgs()
+    taskset_file = args.file
+    num_cores = int(args.m)
+    scheduling_algorithm = args.v
+    num_workers = args.w if args.w is not None else os.cpu_count()
+
+    task_set = read_taskset(taskset_file)
+
+    if args.min_cores:
+        min_cores_results = {}
+        if scheduling_algorithm == "partitioned":
+            heuristics = [args.h] if args.h not in [None, "auto"] else GREEDY_HEURISTICS
+            if args.h == "bb":
+                # the branch and bound orders the tasks itself
+                orderings = ["du"]
+            else:
+                orderings = [args.s] if args.s is not None else list(PARTITION_ORDERINGS)
+            # the verdict of a subset of tasks on one core does not depend on the heuristic
+            verdict_cache = {}
+            for heuristic in heuristics:
+                for ordering in orderings:
+                    min_cores_results[f"partitioned {heuristic}-{ordering}"] = find_min_cores_partitioned(
+                        task_set, num_cores, heuristic, ordering, num_workers, verdict_cache, args.p, args.repair,
+                        args.bb_timeout)
+        else:
+            min_cores_results[str(scheduling_algorithm)] = find_min_cores_global(task_set, num_cores, scheduling_algorithm)
+
+        for variant, min_cores in min_cores_results.items():
+            if min_cores is None:
+                print(f"min cores {variant}: not found (m <= {num_cores})")
+            else:
+                print(f"min cores {variant}: {min_cores}")
+        found = any(min_cores is not None for min_cores in min_cores_results.values())
+        print(f"exit {0 if found else 3}")
+        exit(0 if found else 3)
+
+    stats = SimulationStats() if args.stats or args.misses is not None else None
+    miss_handling = MissHandling(args.misses, args.max_misses, args.time_budget) if args.misses is not None else None
+    is_feasible, need_simulation, cannot_tell = run(task_set, num_cores, scheduling_algorithm,
+                                                    args.h, args.s, num_workers, args.p,
+                                                    stats=stats, miss_handling=miss_handling, portfolio=args.portfolio,
+                                                    repair_budget=args.repair, bb_timeout=args.bb_timeout,
+                                                    cluster_size=args.c)
+    if stats is not None:
+        print(stats if stats.tasks else "No simulation, no statistics")
+    code = exit_code(is_feasible, need_simulation, cannot_tell)
+    print(f"exit {code}")
+    exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,589 @@
+from .datatypes import *
+from . import scheduling_functions
+from . import preprocessor
+from . import help_functions
+import threading
+import time
+
+class Processor:
+    def __init__(self, processor_id: int) -> None:
+        self.processor_id = processor_id
+        self.task_set = TaskSet([])
+        self.jobs = []
+        self.capacity = 1
+        self.load = 0.0
+        # a log of string for simulation
+        self.log = []
+        self.need_simulation = False
+        # worst case response time of each task (task_id -> R), filled by the partitioner for fixed priority policies
+        self.response_times = {}
+        # statistics of the simulation of the processor, filled if set, see SimulationStats
+        self.stats = None
+        # go on simulating after a deadline miss if set, see MissHandling
+        self.miss_handling = None
+        # race the synchronous and asynchronous simulations in two processes, see simulate_processor_portfolio
+        self.portfolio = False
+
+    def __str__(self):
+        # show id, capacity, load. load only show 2 decimal places
+        return f"Processor{self.processor_id}: Capacity: {self.capacity}, Load: {self.load:.2f}"
+    
+    def schedule(self, scheduling_function, time_max: int, time_step: int) -> NewBool:
+        # the simulator is only imported by the processors that need a simulation
+        from . import simulation_functions
+        return simulation_functions.schedule(self.task_set, scheduling_function, time_max, time_step, processor=self,
+                                             stats=self.stats, miss_handling=self.miss_handling)
+
+class Partitioner:
+    def __init__(self, task_set: TaskSet, processors: List[Processor], ordering, policy = "edf",
+                 repair_budget: float = None, bb_timeout: float = 10.0) -> None:
+        self.task_set = task_set
+        self.processors = processors
+        self.ordering = ordering
+        # scheduling policy of each processor, used by the admission test
+        self.policy = scheduling_functions.get_policy(policy)
+        self.partition_method = None
+        # index of the next task to assign, so a partition that failed can be resumed with more processors
+        self.next_task_index = 0
+        # next fit never goes back to the processors it left
+        self.next_fit_processor_index = 0
+        # response times of the processor with the task that was last checked by fits()
+        self.candidate_response_times = {}
+        # seconds of local search when the heuristic finds no processor for a task, no repair if None, see repair()
+        self.repair_budget = repair_budget
+        # number of tasks placed by the repair, the partition was rescued if it passed with some
+        self.repaired_tasks = 0
+        # verdicts of the admission test of the task ids of a processor, see admits()
+        self.admission_cache = {}
+        # seconds before the branch and bound gives up, it then keeps the partial partition that placed the most tasks
+        self.bb_timeout = bb_timeout
+        # the branch and bound gave up, the taskset may or may not have a partition
+        self.timed_out = False
+        # the partition failed but a partition may exist: the branch and bound gave up, or it only had
+        # the tests of the synchronous arrival for an asynchronous taskset, see branch_and_bound()
+        self.cannot_tell = False
+        # task_id of each task split by semi_partition -> ids of its pieces, in the order they run
+        self.split_tasks = {}
+
+    def is_resumable(self) -> bool:
+        """
+        First fit, next fit and best fit would take the same decisions for the tasks already assigned
+        if the processor added last had been there from the start, so their partition can be resumed.
+        Worst fit would prefer the new empty processor and must start over.
+        """
+        return self.partition_method in ["first_fit", "next_fit", "best_fit"]
+
+    def add_processor(self, processor: Processor) -> None:
+        """
+        Add an empty processor, the next call to partition() continues from the task that did not fit
+        if the partition method is resumable, otherwise it starts over
+        """
+        self.processors.append(processor)
+        if not self.is_resumable():
+            for processor in self.processors:
+                processor.task_set = TaskSet([])
+                processor.load = 0.0
+                processor.response_times = {}
+            self.next_task_index = 0
+            self.next_fit_processor_index = 0
+
+    def fits(self, processor: Processor, task: Task) -> bool:
+        """
+        Admission test of task on processor: the load must stay within the capacity.
+        This is exact for EDF with implicit deadlines and necessary for any policy.
+        With fixed priorities the response times of the processor are also checked, so an admitted processor
+        needs no simulation, other policies are checked after the partition
+        """
+        if not help_functions.is_greater_or_equal(processor.capacity - processor.load, task.utilization):
+            return False
+        if not self.policy.is_fixed_priority:
+            return True
+        response_times = self.response_times_with(processor, task)
+        if response_times is None:
+            return False
+        self.candidate_response_times[processor] = response_times
+        return True
+
+    def response_times_with(self, processor: Processor, task: Task) -> dict:
+        """
+        Response times of the tasks of processor once task is added, None if a deadline is missed.
+        Only task and the tasks of lower priority are analysed, the lower priority ones
+        start their iteration from their cached response time since adding a task can only make it longer
+        """
+        task_key = (self.policy.task_priority_key(task), task.task_id)
+        higher_priority_tasks = []
+        lower_priority_tasks = []
+        for core_task in processor.task_set.tasks:
+            if (self.policy.task_priority_key(core_task), core_task.task_id) < task_key:
+                higher_priority_tasks.append(core_task)
+            else:
+                lower_priority_tasks.append(core_task)
+
+        response_times = dict(processor.response_times)
+        wcrt = preprocessor.response_time(task, higher_priority_tasks)
+        if wcrt > task.deadline:
+            return None
+        response_times[task.task_id] = wcrt
+        for lp_task in lower_priority_tasks:
+            lp_key = (self.policy.task_priority_key(lp_task), lp_task.task_id)
+            lp_higher_priority_tasks = [core_task for core_task in processor.task_set.tasks
+                                        if (self.policy.task_priority_key(core_task), core_task.task_id) < lp_key]
+            lp_higher_priority_tasks.append(task)
+            wcrt = preprocessor.response_time(lp_task, lp_higher_priority_tasks, start=processor.response_times[lp_task.task_id])
+            if wcrt > lp_task.deadline:
+                return None
+            response_times[lp_task.task_id] = wcrt
+        return response_times
+
+    def assign(self, processor: Processor, task: Task) -> None:
+        """
+        Assign task to processor, it must have been admitted by fits() just before
+        """
+        processor.task_set = processor.task_set.with_tasks(processor.task_set.tasks + (task,))
+        processor.load += task.utilization
+        if self.policy.is_fixed_priority:
+            processor.response_times = self.candidate_response_times[processor]
+        self.candidate_response_times = {}
+
+    def set_tasks(self, processor: Processor, tasks: List[Task]) -> None:
+        """
+        Replace the tasks of processor by tasks that passed admits()
+        """
+        processor.task_set = processor.task_set.with_tasks(tasks)
+        processor.load = sum(task.utilization for task in tasks)
+        processor.response_times = self.admits(tasks)[1]
+
+    def admits(self, tasks: List[Task]):
+        """
+        Exact admission test of tasks on one processor for the synchronous arrival, the worst case:
+        the response time analysis for fixed priorities, the processor demand analysis for EDF,
+        the load for round robin. Returns whether they are admitted and their response times (fixed priorities only)
+        """
+        # the pieces of a split task are tried with several computation times under the same id
+        key = frozenset((task.task_id, task.computation_time, task.deadline, task.period) for task in tasks)
+        if key in self.admission_cache:
+            return self.admission_cache[key]
+        admitted, response_times = False, {}
+        if help_functions.is_greater_or_equal(1, sum(task.utilization for task in tasks)):
+            if self.policy.is_fixed_priority:
+                admitted = True
+                higher_priority_tasks = []
+                for task in self.policy.sort_by_priority(tasks):
+                    response_times[task.task_id] = preprocessor.response_time(task, higher_priority_tasks)
+                    if response_times[task.task_id] > task.deadline:
+                        admitted = False
+                        break
+                    higher_priority_tasks.append(task)
+            elif self.policy.name == "edf":
+                admitted = preprocessor.processor_demand_test(tasks)
+            else:
+                admitted = True
+        self.admission_cache[key] = (admitted, response_times)
+        return admitted, response_times
+
+    def repair(self, task: Task, stop_time: float) -> Processor:
+        """
+        Local search for a task the heuristic could place on no processor. The task is first inserted as is
+        on a processor that admits it (next fit only tries its current processor), otherwise two neighbourhoods:
+        a move, task replaces a task x of a processor p and x goes to another processor q,
+        and a swap, x of p and y of q are exchanged and task joins p.
+        Every processor touched must pass admits(), the candidate leaving the largest smallest slack
+        (capacity - load) on the processors it touches is applied.
+        Returns the processor the task joined, None if no candidate is found before stop_time (time.perf_counter())
+        """
+        best_slack, best_change = None, None
+        for p in self.processors:
+            new_p_tasks = list(p.task_set.tasks) + [task]
+            slack = p.capacity - p.load - task.utilization
+            if help_functions.is_smaller(slack, 0) or (best_slack is not None and slack <= best_slack):
+                continue
+            if self.admits(new_p_tasks)[0]:
+                best_slack = slack
+                best_change = [(p, new_p_tasks)]
+        if best_change is not None:
+            self.set_tasks(*best_change[0])
+            return best_change[0][0]
+        for p in self.processors:
+            for x in p.task_set.tasks:
+                p_tasks = [core_task for core_task in p.task_set.tasks if core_task is not x]
+                for q in self.processors:
+                    if q is p:
+                        continue
+                    if time.perf_counter() > stop_time:
+                        print("repair: time budget exhausted")
+                        return None
+                    # move x to q
+                    candidates = [(p_tasks + [task], list(q.task_set.tasks) + [x])]
+                    # swap x with y of q
+                    candidates += [(p_tasks + [y, task], [core_task for core_task in q.task_set.tasks if core_task is not y] + [x])
+                                   for y in q.task_set.tasks]
+                    for new_p_tasks, new_q_tasks in candidates:
+                        p_load = sum(core_task.utilization for core_task in new_p_tasks)
+                        q_load = sum(core_task.utilization for core_task in new_q_tasks)
+                        slack = min(p.capacity - p_load, q.capacity - q_load)
+                        if help_functions.is_smaller(slack, 0) or (best_slack is not None and slack <= best_slack):
+                            continue
+                        if not self.admits(new_p_tasks)[0] or not self.admits(new_q_tasks)[0]:
+                            continue
+                        best_slack = slack
+                        best_change = [(p, new_p_tasks), (q, new_q_tasks)]
+        if best_change is None:
+            return None
+        for processor, tasks in best_change:
+            self.set_tasks(processor, tasks)
+        # the task joined p
+        return best_change[0][0]
+
+    def repair_partition(self, partition_method: str) -> bool:
+        """
+        Place the task the heuristic could not place with repair(), and go on with the heuristic, until every task is placed.
+        Next fit goes on from the processor the repaired task joined, like from the processor of the last task it placed
+        """
+        stop_time = time.perf_counter() + self.repair_budget
+        while True:
+            task = self.task_set.tasks[self.next_task_index]
+            processor = self.repair(task, stop_time)
+            if processor is None:
+                print(f"repair: no move or swap makes room for task {task.task_id}, {self.repaired_tasks} tasks repaired")
+                return False
+            self.repaired_tasks += 1
+            self.next_task_index += 1
+            self.next_fit_processor_index = self.processors.index(processor)
+            if getattr(self, partition_method)():
+                print(f"repair: partitioned successfully, {self.repaired_tasks} tasks repaired")
+                return True
+
+    def partition(self, partition_method: str)-> bool:
+        # check task_set.tasks list is not empty
+        if len(self.task_set.tasks) == 0:
+            print("partioner: Task set is empty")
+            return True
+        # check processors list is not empty
+        if len(self.processors) == 0:
+            print("partioner: Processors list is empty")
+            return False
+        
+        if self.next_task_index > 0 and partition_method != self.partition_method:
+            print("partioner: cannot resume a partition with another method")
+            return False
+        self.partition_method = partition_method
+
+        # partition the task set into processors
+        # sort task set by utilization, a resumed partition is already sorted
+        if self.next_task_index == 0:
+            if self.ordering == "iu":
+                # increase utilization order
+                self.task_set = self.task_set.by_increasing_utilization
+                print(self.task_set)
+            elif self.ordering == "du":
+                # decrease utilization order
+                self.task_set = self.task_set.by_decreasing_utilization
+                print(self.task_set)
+            elif self.ordering == "dd":
+                # decrease density order, C / min(D, T)
+                self.task_set = self.task_set.by_decreasing_density
+                print(self.task_set)
+            elif self.ordering == "ddl":
+                # decrease deadline order
+                self.task_set = self.task_set.by_decreasing_deadline
+                print(self.task_set)
+        
+        is_partion_success = False
+        # assign tasks to processors
+        if partition_method == "first_fit":
+            is_partion_success = self.first_fit()
+        elif partition_method == "next_fit":
+            is_partion_success = self.next_fit()
+        elif partition_method == "best_fit":
+            is_partion_success = self.best_fit()
+        elif partition_method == "worst_fit":
+            is_partion_success = self.worst_fit()
+        elif partition_method == "branch_and_bound":
+            is_partion_success = self.branch_and_bound()
+        elif partition_method == "semi_partition":
+            is_partion_success = self.semi_partition()
+        else:
+            print("partioner: No such partition method")
+            return False
+
+        if not is_partion_success and self.repair_budget is not None and partition_method != "branch_and_bound":
+            is_partion_success = self.repair_partition(partition_method)
+        return is_partion_success
+
+    # First Fit, Next Fit, Best Fit and Worst Fit
+    def first_fit(self)-> bool:
+        # scan the processors list, find the first free processor and assign the task to it
+        for task in self.task_set.tasks[self.next_task_index:]:
+            print(task)
+            find_processor_flag = False
+            for processor in self.processors:
+                # print(f"processor {processor.processor_id}: c-l = {float(processor.capacity - processor.load):.3f}, u = {task.utilization:.3f}")
+                if self.fits(processor, task):
+                    self.assign(processor, task)
+                    find_processor_flag = True
+                    break
+            if not find_processor_flag:
+                print(f"first_fit: No free processor found for task {task.task_id}")
+                #TODO: not schedulable for first fit
+                return False
+            self.next_task_index += 1
+        print("first_fit: partitioned successfully")
+        return True
+            
+    def next_fit(self)-> bool:
+        # Next-ﬁt: assign it to the current processor being considered, and if it cannot ﬁt, it moves to the next available processor. 
+        # It can never be assigned to the previous processors.
+        taskset_list = list(self.task_set.tasks[self.next_task_index:])
+        for processor in self.processors[self.next_fit_processor_index:]:
+            while taskset_list:
+                task = taskset_list[0]
+                if self.fits(processor, task):
+                    self.assign(processor, task)
+                    taskset_list.pop(0)
+                    self.next_task_index += 1
+                else:
+                    # move to the next processor
+                    break
+            if taskset_list:
+                self.next_fit_processor_index += 1
+        if taskset_list:
+            print(f"next_fit: No free processor found for task {taskset_list[0].task_id}")
+            # not schedulable for next fit
+            return False
+        else:
+            print("next_fit: partitioned successfully")
+            return True
+
+    def best_fit(self)-> bool:
+        # Best-ﬁt: assign it to an eligible processor with the maximum load U(tau)
+        for task in self.task_set.tasks[self.next_task_index:]:
+            best_processor = None
+            max_load = 0
+            task_first_fit_flag = True
+            # find the best processor
+            for processor in self.processors:
+                if self.fits(processor, task):
+                    if task_first_fit_flag:
+                        best_processor = processor
+                        task_first_fit_flag = False
+                        max_load = processor.load
+                        continue
+                    if help_functions.is_equal(processor.load, max_load):
+                        # not improving
+                        continue
+                    if help_functions.is_greater_or_equal(processor.load, max_load):
+                        # is actually improving, if equal, it should be continued in the if before
+                        best_processor = processor
+                        max_load = processor.load
+
+            if best_processor is None:
+                print(f"best_fit: No free processor found for task {task.task_id}")
+                #TODO: not schedulable for best fit
+                return False
+            else:
+                self.assign(best_processor, task)
+                self.next_task_index += 1
+        print("best_fit: partitioned successfully")
+        return True
+
+    def worst_fit(self)-> bool:
+        # Worst-ﬁt: assign it to an eligible processor with the minimum load U(tau)
+        for task in self.task_set.tasks[self.next_task_index:]:
+            worst_processor = None
+            min_load = 1
+            task_first_fit_flag = True
+            # find the worst processor
+            for processor in self.processors:
+                if self.fits(processor, task):
+                    if task_first_fit_flag:
+                        worst_processor = processor
+                        task_first_fit_flag = False
+                        min_load = processor.load
+                        continue
+                    if help_functions.is_equal(processor.load, min_load):
+                        # not improving
+                        continue
+                    if help_functions.is_smaller_or_equal(processor.load, min_load):
+                        # is actually improving, if equal, it should be continued in the if before
+                        worst_processor = processor
+                        min_load = processor.load
+            if worst_processor is None:
+                print(f"worst_fit: No free processor found for task {task.task_id}")
+                #TODO: not schedulable for worst fit
+                return False
+            else:
+                self.assign(worst_processor, task)
+                self.next_task_index += 1
+        print("worst_fit: partitioned successfully")
+        return True
+
+    def branch_and_bound(self) -> bool:
+        """
+        Search of a partition where every processor passes admits(), tasks by decreasing utilization.
+        A task goes to the loaded processors first and to one empty processor only, the empty ones are identical.
+        A branch is cut when the utilization left does not fit in the capacity left, or when a task left fits
+        on no processor by load or by demand at its first deadline. The sets of processors that failed
+        from a task on are remembered, whatever the order of the processors.
+        Before the search, the demand of all tasks at each first deadline D must be at most m * D.
+        The demand cuts are skipped for round robin, its admission test only looks at the load.
+        admits() and the demand cuts look at the synchronous arrival, they are exact for a synchronous taskset
+        (and for round robin) but only sufficient for an asynchronous one: no partition found then sets cannot_tell.
+        After bb_timeout seconds the partial partition that placed the most tasks is kept and timed_out is set
+        """
+        tasks = list(self.task_set.by_decreasing_utilization.tasks)
+        num_processors = len(self.processors)
+        stop_time = time.perf_counter() + self.bb_timeout
+        utilization_left = [sum(task.utilization for task in tasks[index:]) for index in range(len(tasks) + 1)]
+        cores = [[] for _ in self.processors]
+        loads = [0.0] * num_processors
+        failed_states = set()
+        best_partial = (0, [[] for _ in self.processors])
+        demand_cuts = not self.policy.is_round_robin
+        exact = self.task_set.is_synchronous or self.policy.is_round_robin
+
+        if help_functions.is_greater(utilization_left[0], num_processors):
+            print(f"branch_and_bound: the tasks need more than {num_processors} processors")
+            return False
+        if demand_cuts and any(preprocessor.demand_bound(tasks, task.deadline) > num_processors * task.deadline
+                               for task in tasks):
+            self.cannot_tell = not exact
+            print(f"branch_and_bound: the synchronous demand of the tasks needs more than {num_processors} processors"
+                  + ("" if exact else ", the taskset is asynchronous so a partition may still exist"))
+            return False
+
+        def fits_somewhere(task: Task) -> bool:
+            return any(help_functions.is_greater_or_equal(1 - loads[core], task.utilization)
+                       and (not demand_cuts
+                            or preprocessor.demand_bound(cores[core], task.deadline) + task.computation_time <= task.deadline)
+                       for core in range(num_processors))
+
+        def search(index: int) -> bool:
+            nonlocal best_partial
+            if index == len(tasks):
+                return True
+            if index > best_partial[0]:
+                best_partial = (index, [list(core_tasks) for core_tasks in cores])
+            if time.perf_counter() > stop_time:
+                self.timed_out = True
+                return False
+            state = (index, frozenset(frozenset(task.task_id for task in core_tasks) for core_tasks in cores if core_tasks))
+            if state in failed_states:
+                return False
+            if help_functions.is_greater(utilization_left[index], num_processors - sum(loads)):
+                failed_states.add(state)
+                return False
+
+            task = tasks[index]
+            tried_empty_processor = False
+            for core in sorted(range(num_processors), key=lambda core: loads[core], reverse=True):
+                if not cores[core]:
+                    if tried_empty_processor:
+                        continue
+                    tried_empty_processor = True
+                if not help_functions.is_greater_or_equal(1 - loads[core], task.utilization):
+                    continue
+                if not self.admits(cores[core] + [task])[0]:
+                    continue
+                cores[core].append(task)
+                loads[core] = sum(core_task.utilization for core_task in cores[core])
+                if all(fits_somewhere(next_task) for next_task in tasks[index + 1:]) and search(index + 1):
+                    return True
+                cores[core].pop()
+                loads[core] = sum(core_task.utilization for core_task in cores[core])
+                if self.timed_out:
+                    return False
+            failed_states.add(state)
+            return False
+
+        found = search(0)
+        if not found and not self.timed_out:
+            self.cannot_tell = not exact
+            print(f"branch_and_bound: no partition on {num_processors} processors, {len(failed_states)} states explored"
+                  + ("" if exact else ", the taskset is asynchronous so a partition may still pass a simulation"))
+            return False
+        placed_tasks, partition = (len(tasks), cores) if found else best_partial
+        for processor, core_tasks in zip(self.processors, partition):
+            self.set_tasks(processor, core_tasks)
+        self.next_task_index = placed_tasks
+        if not found:
+            self.cannot_tell = True
+            print(f"branch_and_bound: time budget exhausted, the best partial partition places {placed_tasks} of {len(tasks)} tasks")
+            for processor in self.processors:
+                print(f"{processor}, tasks {[task.task_id for task in processor.task_set.tasks]}")
+            return False
+        print("branch_and_bound: partitioned successfully")
+        return True
+
+    def split(self, task: Task, first_piece_id: int):
+        """
+        C=D splitting of a task no processor admits whole: on each processor in turn, the first piece gets the largest
+        C' = D' the processor admits, the rest (C - C', D - C') is released C' later and goes on to the next processors
+        until one admits it whole. A piece with C' = D' has no laxity, it completes C' after its release,
+        so the next piece can be released then.
+        Returns the processor of each piece, None if the processors run out first
+        """
+        pieces = []
+        rest = task
+        for processor in self.processors:
+            tasks = list(processor.task_set.tasks)
+            piece_id = first_piece_id + len(pieces)
+            piece_name = f"{task.name}_{len(pieces) + 1}"
+            last_piece = Task(piece_id, piece_name, rest.computation_time, rest.period, rest.deadline, rest.offset)
+            if self.admits(tasks + [last_piece])[0]:
+                pieces.append((processor, last_piece))
+                return pieces
+            for computation_time in range(rest.computation_time - 1, 0, -1):
+                piece = Task(piece_id, piece_name, computation_time, rest.period, computation_time, rest.offset)
+                if self.admits(tasks + [piece])[0]:
+                    pieces.append((processor, piece))
+                    rest = Task(task.task_id, task.name, rest.computation_time - computation_time, rest.period,
+                                rest.deadline - computation_time, rest.offset + computation_time)
+                    break
+        return None
+
+    def semi_partition(self) -> bool:
+        """
+        Semi-partitioned EDF: first fit with admits(), a task no processor admits is split over several processors,
+        see split(). The pieces are tasks of their processors with new ids, split_tasks keeps them
+        """
+        next_piece_id = max(task.task_id for task in self.task_set.tasks) + 1
+        for task in self.task_set.tasks[self.next_task_index:]:
+            processor = next((processor for processor in self.processors
+                              if self.admits(list(processor.task_set.tasks) + [task])[0]), None)
+            if processor is not None:
+                self.set_tasks(processor, list(processor.task_set.tasks) + [task])
+                self.next_task_index += 1
+                continue
+            pieces = self.split(task, next_piece_id)
+            if pieces is None:
+                print(f"semi_partition: task {task.task_id} cannot be split over the processors")
+                return False
+            for processor, piece in pieces:
+                self.set_tasks(processor, list(processor.task_set.tasks) + [piece])
+            self.split_tasks[task.task_id] = [piece.task_id for _, piece in pieces]
+            next_piece_id += len(pieces)
+            self.next_task_index += 1
+        print("semi_partition: partitioned successfully")
+        return True
+
+
+if __name__ == "__main__":
+    # tests
+    test_taskset = TaskSet([Task(1, "task1", 8, 10, 10, 0), 
+                            Task(2, "task2", 7, 10, 10, 0), 
+                            Task(3, "task3", 6, 10, 10, 0), 
+                            Task(4, "task4", 5, 10, 10, 0), 
+                            Task(5, "task5", 4, 10, 10, 0),
+                            Task(6, "task6", 2, 10, 10, 0),
+                            Task(7, "task7", 1, 10, 10, 0)])
+    print(test_taskset)
+    test_processors = [Processor(1), 
+                    Processor(2), 
+                    Processor(3),
+                    Processor(4)]
+
+    test_partitioner = Partitioner(test_taskset, test_processors, "iu")
+    test_partitioner.partition("best_fit")
+    for processor in test_processors:
+        print(processor)
+        print(processor.task_set)
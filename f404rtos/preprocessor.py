@@ -0,0 +1,419 @@
+from .datatypes import *
+import math
+from . import help_functions
+from . import global_edf_tests
+from . import scheduling_functions
+
+def response_time(task: Task, higher_priority_tasks: List[Task], is_print: bool = False, start: int = None) -> int:
+    """
+    Worst case response time of task under fixed task priorities, for a synchronous arrival.
+    Constrained deadline: iterate wcrt_k = C + sum_j( ceil( wcrt_(k-1) / T_j ) * C_j ) until it is stable.
+    start can be a known lower bound, e.g. the response time before a higher priority task was added,
+    the iteration then continues from it instead of starting over.
+    Arbitrary deadline: every job of the level-i busy period is checked.
+    Stop as soon as it is larger than the deadline
+    """
+    if task.deadline > task.period:
+        return _response_time_arbitrary_deadline(task, higher_priority_tasks, is_print)
+
+    if start is None:
+        start = task.computation_time + sum(hp_task.computation_time for hp_task in higher_priority_tasks)
+    wcrt = start
+    while True:
+        last_wcrt = wcrt
+        wcrt = task.computation_time
+        for hp_task in higher_priority_tasks:
+            wcrt += math.ceil(last_wcrt/hp_task.period) * hp_task.computation_time
+        if is_print: print(f"{task.name} update wcrt = {wcrt}")
+        if wcrt > task.deadline:
+            return wcrt
+        if wcrt == last_wcrt:
+            if is_print: print(f"{task.name} with wcrt = {wcrt} <= {task.deadline}, pass")
+            return wcrt
+
+def _response_time_arbitrary_deadline(task: Task, higher_priority_tasks: List[Task], is_print: bool = False) -> int:
+    """
+    Worst case response time with D > T, several jobs of task can be pending:
+    the q-th job of the level-i busy period finishes at w_q = (q+1) * C + sum_j( ceil( w_q / T_j ) * C_j )
+    """
+    # length of the level-i busy period
+    level_tasks = higher_priority_tasks + [task]
+    if help_functions.is_greater(sum(level_task.utilization for level_task in level_tasks), 1):
+        return math.inf
+    busy_period = sum(level_task.computation_time for level_task in level_tasks)
+    while True:
+        next_busy_period = sum(math.ceil(busy_period/level_task.period) * level_task.computation_time
+                               for level_task in level_tasks)
+        if next_busy_period == busy_period:
+            break
+        busy_period = next_busy_period
+
+    wcrt = 0
+    finish_time = 0
+    for q in range(math.ceil(busy_period/task.period)):
+        finish_time = max(finish_time, (q+1) * task.computation_time)
+        while True:
+            next_finish_time = (q+1) * task.computation_time
+            for hp_task in higher_priority_tasks:
+                next_finish_time += math.ceil(finish_time/hp_task.period) * hp_task.computation_time
+            if next_finish_time == finish_time:
+                break
+            finish_time = next_finish_time
+        wcrt = max(wcrt, finish_time - q * task.period)
+        if is_print: print(f"{task.name} job {q} of the busy period, response time = {finish_time - q * task.period}")
+        if wcrt > task.deadline:
+            return wcrt
+    return wcrt
+
+def demand_bound(tasks: List[Task], t: int) -> int:
+    """
+    Processor demand of the jobs of tasks released and due in [0, t] for a synchronous arrival,
+    dbf(t) = sum_i( max(0, floor((t - D_i) / T_i) + 1) * C_i )
+    """
+    return sum((((t - task.deadline) // task.period) + 1) * task.computation_time
+               for task in tasks if t >= task.deadline)
+
+def processor_demand_test(tasks: List[Task]) -> bool:
+    """
+    EDF schedulability of tasks on one processor for a synchronous arrival, the worst case, with the
+    quick processor demand analysis (QPA, Zhang and Burns): demand_bound(t) <= t
+    for every absolute deadline t below L, walking the deadlines down from L and jumping to dbf(t) when it is smaller.
+    L is the synchronous busy period, or (sum_i( (T_i - D_i) * U_i )) / (1 - U) if it is smaller and U < 1
+    """
+    utilization = sum(task.utilization for task in tasks)
+    if help_functions.is_greater(utilization, 1):
+        return False
+    if all(task.deadline >= task.period for task in tasks):
+        # U <= 1 is exact when no deadline is shorter than its period
+        return True
+
+    def last_deadline_before(t: int) -> int:
+        # largest absolute deadline strictly smaller than t, 0 if there is none
+        return max((task.deadline + (math.ceil((t - task.deadline) / task.period) - 1) * task.period
+                    for task in tasks if t > task.deadline), default=0)
+
+    busy_period = sum(task.computation_time for task in tasks)
+    while True:
+        next_busy_period = sum(math.ceil(busy_period / task.period) * task.computation_time for task in tasks)
+        if next_busy_period == busy_period:
+            break
+        busy_period = next_busy_period
+    bound = busy_period
+    if help_functions.is_smaller(utilization, 1):
+        bound = min(bound, max(max(task.deadline for task in tasks),
+                               math.ceil(sum((task.period - task.deadline) * task.utilization for task in tasks)
+                                         / (1 - utilization))))
+
+    min_deadline = min(task.deadline for task in tasks)
+    t = last_deadline_before(bound + 1)
+    demand = demand_bound(tasks, t)
+    while min_deadline < demand <= t:
+        t = demand if demand < t else last_deadline_before(t)
+        demand = demand_bound(tasks, t)
+    return demand <= min_deadline
+
+
+
+def edf_k_needed_cores(k_value: int, k_th_utilisation: float, k_plus1_sum_utilisation: float) -> int:
+    """
+    Number of cores Theorem 93 needs for EDF^(k): the k-1 tasks of largest utilisation get a core each,
+    and the tasks from the k-th on share (at least one core) ceil(U(tau^(k+1)) / (1 - U_k)) cores.
+    None if the k-th task cannot share its core with the tasks after it
+    """
+    if help_functions.is_equal(k_plus1_sum_utilisation, 0):
+        # the k-th task alone
+        shared_cores = 1
+    elif help_functions.is_greater_or_equal(k_th_utilisation, 1):
+        return None
+    else:
+        shared_cores = max(1, help_functions.ceil(k_plus1_sum_utilisation/(1-k_th_utilisation)))
+    return (k_value-1) + shared_cores
+
+
+class Preprocessor:
+    def __init__(self, task_set: TaskSet, scheduling_algorithm: str):
+        # the taskset to simulate, replaced by its rescaled copy by set_simulator_timestep
+        self.task_set = task_set
+        self.scheduling_algorithm = scheduling_algorithm
+        self.do_simulation = False
+        # length of the simulation and time step, in the time units of self.task_set
+        self.feasibility_interval = 1
+        self.simulator_timestep = 1
+        # the offsets of self.task_set are this much smaller than in the taskset given, see normalize_offsets
+        self.offset_shift = 0
+
+    def normalize_offsets(self) -> None:
+        """
+        Shift the offsets of all tasks by the smallest one. Nothing is released before it, so the schedule is the same,
+        only shift earlier: the verdicts do not change, and the feasibility interval Omax + 2P shrinks.
+        A taskset whose offsets are all equal becomes synchronous, so the synchronous tests and the idle point apply.
+        Reducing an offset by a multiple of its period is not done: it releases more jobs, the verdict may change
+        """
+        shift = self.task_set.min_offset
+        self.task_set = self.task_set.shifted(shift)
+        self.offset_shift += shift
+
+    def check_taskset_properties(self, is_print: bool = False):
+        """
+        print whether the taskset is synchronous and its deadline type, the taskset computes them once
+        """
+        if not is_print:
+            return
+        if self.offset_shift > 0:
+            print(f"offsets shifted by {self.offset_shift}, the smallest offset")
+        for task in self.task_set.tasks:
+            if task.offset != 0:
+                print(task.name + " has a non-zero offset, taskset is asynchronous")
+                break
+        print("taskset is synchronous" if self.task_set.is_synchronous else "taskset is asynchronous")
+        print(f"taskset has {self.task_set.deadline_type} deadline")
+
+    def set_feasibility_interval(self) -> None:
+        """
+        Set the feasibility interval.
+        For synchronous task sets:
+        * constrainted ddl:
+            - For rr, use the hyperperiod
+            - For edf, use the hyperperiod first, it will stop early when idle point found (Corollary 59)
+            - For other FTP algorithms, use the maximum deadline among all tasks (corollary 32)
+        * arbitrary ddl:
+            - use the hyperperiod first, it will stop early when idle point found (Theorem 40)
+        For asynchronous task sets:
+        - Use Omax + 2P, where Omax is the maximum offset and P is the hyperperiod
+        """
+        if self.task_set.is_synchronous:
+            self._set_synchronous_feasibility_interval()
+        else:
+            self._set_asynchronous_feasibility_interval()
+
+    def _set_synchronous_feasibility_interval(self) -> None:
+        if self.task_set.deadline_type == "implicit" or self.task_set.deadline_type == "constrained":
+            if self.scheduling_algorithm in ["rr", "edf"]:
+                self.feasibility_interval = self.task_set.hyperperiod
+            else:
+                self.feasibility_interval = self.task_set.max_deadline
+        else:
+            # arbitrary deadline, need find idle point, set feasibility interval to hyper period first
+            self.feasibility_interval = self.task_set.hyperperiod
+
+    def _set_asynchronous_feasibility_interval(self) -> None:
+        self.feasibility_interval = self.task_set.max_offset + 2 * self.task_set.hyperperiod
+
+    def set_simulator_timestep(self):
+        """
+        Rescale the taskset by the greatest common divisor of all tasks' C, T, D, O,
+        so the simulator runs in unit steps on smaller integers.
+        The factor is kept in task_set.time_scale to report results in the original time units
+        """
+        factor = self.task_set.gcd
+        # the feasibility interval is built from T, D, O, so it is divisible by the gcd too
+        if factor > 1:
+            self.feasibility_interval //= factor
+        self.task_set = self.task_set.rescaled(factor)
+        self.simulator_timestep = 1
+
+    def feasibility_check(self, is_print: bool) -> bool:
+        """
+        Check if the taskset is feasible for the given scheduling algorithm, and if not sure, do simulation
+        """
+        # make sure do_simulation init with False
+        self.do_simulation = False
+
+        # utilisation check
+        sum_utilisation = self.task_set.utilization
+        if help_functions.is_greater(sum_utilisation, 1):
+            # if sum of utilisation > 1, not feasible, return False
+            return False
+        # if there is only one/no task in taskset
+        if len(self.task_set.tasks) <= 1:
+            if is_print: print("taskset has only one/no task, utiliasion check pass")
+            return True
+        # if taskset is implicit deadline, for the priority driven policies
+        if self.task_set.deadline_type == "implicit" and self.scheduling_algorithm != "rr":
+            # DM become RM, utilisation check possible:
+            # Theorem 33
+            n_task = len(self.task_set.tasks)
+            if n_task > 0:
+                if sum_utilisation <= n_task * (2**(1/n_task) - 1):
+                    return True
+            else:
+                if is_print: print("taskset has no task")
+                return True
+
+        if self.scheduling_algorithm in ["dm", "rm"]:
+            # There is exact schedulability test for fixed task priorities, the response time analysis
+            # it is exact for synchronous tasksets, only sufficient with offsets
+            policy = scheduling_functions.get_policy(self.scheduling_algorithm)
+            checked_tasks_list: List[Task] = []
+            for task in policy.sort_by_priority(self.task_set.tasks):
+                wcrt = response_time(task, checked_tasks_list, is_print)
+                if wcrt > task.deadline:
+                    if is_print: print(f"{task.name} missed deadline at with wcrt >= {wcrt} > {task.deadline}")
+                    if self.task_set.is_synchronous:
+                        # already miss deadline, not feasible, return False
+                        return False
+                    # the synchronous arrival is only the worst case, simulate with the offsets
+                    self.do_simulation = True
+                    return False
+                checked_tasks_list.append(task)
+            # no need for simulation, exact feasibility check tells FTP feasibility
+            return True
+        
+        if self.scheduling_algorithm == "edf":
+            # edf is ideal for implicit deadline, utilisation check already passed
+            if self.task_set.is_synchronous and self.task_set.deadline_type == "implicit":
+                if is_print: print(f"taskset is synchronous and implicit deadline, no need for simulation")
+                return True
+            # else, must do simulation
+
+        # round robin always need simulation
+        if self.scheduling_algorithm == "rr":
+            pass
+
+        # simulation
+        self.do_simulation = True
+        return False
+
+
+    def preprocess(self, is_print: bool = False) -> NewBool:
+        """
+        Preprocess the taskset to seek shortcuts
+        Returns TRUE or FALSE when the shortcuts tell, CANNOT_TELL when a simulation is needed
+        """
+        self.normalize_offsets()
+        self.check_taskset_properties(is_print)
+        
+        shortcut_is_feasible = self.feasibility_check(is_print)
+
+        if self.do_simulation:
+            self.set_feasibility_interval()
+            self.set_simulator_timestep()
+            return NewBool.CANNOT_TELL
+
+        return NewBool.from_bool(shortcut_is_feasible)
+
+    def preprocess_global_edf(self, task_set: TaskSet, num_cores: int):
+        """
+        Preprocess the taskset to determine if simulation is needed for asynchronous tasks on multiple cores.
+        Returns is_feasible and need_simulation.
+        is_feasible is True if the taskset is schedulable without simulation.
+        is_feasible is False if the taskset is not schedulable or cannot be determined without simulation.
+        need_simulation is True if we need to simulate to determine schedulability.
+        The simulation runs self.task_set over self.feasibility_interval
+        """
+        # Omax + 2P, the synchronous arrival is not the worst case on several cores
+        self.normalize_offsets()
+        self._set_asynchronous_feasibility_interval()
+
+        total_utilization = task_set.utilization
+        max_utilization = task_set.max_utilization
+        print(f"Total utilization: {total_utilization}")
+        
+        if help_functions.is_greater(total_utilization, num_cores):
+            print("Total utilization exceeds the number of cores. Taskset is not schedulable.")
+            return False, False  # Not feasible, no need to simulate
+
+        # Theorem 84
+        if task_set.deadline_type == "implicit" and help_functions.is_smaller_or_equal(max_utilization, 1):
+            print("implicit ddl sys with max utilization is less than or equal to 1. Taskset is schedulable.")
+            return True, False  # Feasible, no need to simulate
+        
+        if task_set.deadline_type == "implicit" and help_functions.is_smaller_or_equal(total_utilization, num_cores - (num_cores - 1)*max_utilization):
+            # Theorem 91
+            print("Theorem 91")
+            return True, False  # Feasible, no need to simulate
+
+        # polynomial time sufficient tests, also for constrained and arbitrary deadlines
+        passing_test = global_edf_tests.find_passing_test(task_set.tasks, num_cores)
+        if passing_test is not None:
+            print(f"{passing_test} test passed. Taskset is schedulable.")
+            return True, False  # Feasible, no need to simulate
+        
+        self.set_simulator_timestep()
+        return False, True  # Feasibility unknown, need to simulate
+    
+    def preprocess_global_edf_k(self, task_set: TaskSet, num_cores, k_value):
+        """
+        Preprocess the taskset to determine if simulation is needed for asynchronous tasks on multiple cores.
+        Returns is_feasible and need_simulation.
+        is_feasible is True if the taskset is schedulable without simulation.
+        is_feasible is False if the taskset is not schedulable or cannot be determined without simulation.
+        need_simulation is True if we need to simulate to determine schedulability.
+        The simulation runs self.task_set, sorted by decreasing utilisation, over self.feasibility_interval
+        """
+        # sort the tasks by utilisation from large to small
+        task_set = task_set.by_decreasing_utilization
+        self.task_set = task_set
+        self.normalize_offsets()
+        self._set_asynchronous_feasibility_interval()
+        print(task_set)
+
+        # the k-th largest utilisation
+        k_th_utilisation = task_set.tasks[k_value-1].utilization
+        # k_plus1_sum_utilisation is the sum of the k+1 th largest utilisation to the end
+        k_plus1_sum_utilisation = sum(task.utilization for task in task_set.tasks[k_value:])
+        print(f"k-th utilisation: {k_th_utilisation}")
+        print(f"k+1 sum utilisation: {k_plus1_sum_utilisation}")
+
+        total_utilization = task_set.utilization
+        print(f"Total utilization: {total_utilization}")
+        
+        if help_functions.is_greater(total_utilization, num_cores):
+            print("Total utilization exceeds the number of cores. Taskset is not schedulable.")
+            return False, False  # Not feasible, no need to simulate
+
+        # Theorem 93
+        needed_cores = edf_k_needed_cores(k_value, k_th_utilisation, k_plus1_sum_utilisation)
+        if task_set.deadline_type == "implicit" and needed_cores is not None and needed_cores <= num_cores:
+            return True, False  # Feasible, no need to simulate
+        
+        self.set_simulator_timestep()
+        return False, True  # Feasibility unknown, need to simulate
+
+    def preprocess_global_edf_k_auto(self, task_set: TaskSet, num_cores: int):
+        """
+        Search the k of EDF^(k) instead of taking it from the user.
+        The tasks are sorted once by decreasing utilisation, then prefix sums give the Theorem 93 condition
+        m >= (k-1) + ceil(U(tau^(k+1)) / (1 - U_k)) for every k in one pass.
+        Returns is_feasible, need_simulation and the chosen k:
+        the k that needs the smallest number of cores, so only this k has to be simulated if it is not proven.
+        The simulation runs self.task_set, sorted by decreasing utilisation, over self.feasibility_interval
+        """
+        # sort the tasks by utilisation from large to small, once
+        task_set = task_set.by_decreasing_utilization
+        self.task_set = task_set
+        self.normalize_offsets()
+        self._set_asynchronous_feasibility_interval()
+        print(task_set)
+
+        # prefix_utilisation[k] is the sum of the k largest utilisations
+        prefix_utilisation = [0.0]
+        for task in task_set.tasks:
+            prefix_utilisation.append(prefix_utilisation[-1] + task.utilization)
+        total_utilization = prefix_utilisation[-1]
+        print(f"Total utilization: {total_utilization}")
+
+        best_k = 1
+        min_cores = math.inf
+        for k_value in range(1, len(task_set.tasks) + 1):
+            k_th_utilisation = task_set.tasks[k_value-1].utilization
+            k_plus1_sum_utilisation = total_utilization - prefix_utilisation[k_value]
+            needed_cores = edf_k_needed_cores(k_value, k_th_utilisation, k_plus1_sum_utilisation)
+            if needed_cores is None:
+                # the remaining tasks cannot share the k-th core
+                continue
+            if needed_cores < min_cores:
+                best_k = k_value
+                min_cores = needed_cores
+        print(f"Theorem 93: best k = {best_k}, smallest number of cores = {min_cores}")
+
+        if help_functions.is_greater(total_utilization, num_cores):
+            print("Total utilization exceeds the number of cores. Taskset is not schedulable.")
+            return False, False, best_k  # Not feasible, no need to simulate
+
+        # Theorem 93
+        if task_set.deadline_type == "implicit" and min_cores <= num_cores:
+            return True, False, best_k  # Feasible, no need to simulate
+
+        self.set_simulator_timestep()
+        return False, True, best_k  # Feasibility unknown, need to simulate
@@ -0,0 +1,102 @@
+from .datatypes import *
+from typing import List, Callable
+from dataclasses import dataclass
+
+
+def highest_priority_first(job_set: List[Job]) -> Job:
+    """
+    Returns the job with the highest static priority (the smallest job.priority), for fixed task priority policies.
+    The priorities of the tasks are computed once by SchedulingPolicy.task_priorities, so no task field is compared here
+    """
+    highest_priority_job = None
+    for job in job_set:
+        if highest_priority_job is None or job.priority < highest_priority_job.priority:
+            highest_priority_job = job
+    return highest_priority_job
+
+def early_deadline_first(job_set: List[Job]) -> Job:
+    """
+    Returns the job with the earliest absolute deadline
+    """
+    highest_priority_job = None
+    for job in job_set:
+        if highest_priority_job is None or job.deadline < highest_priority_job.deadline:
+            # EDF use the absolute ddl of each job
+            highest_priority_job = job
+    return highest_priority_job
+
+# fixed task priority policies only differ by their key, RM and DM are kept as functions for the callers of Project 1
+def rate_monotonic(job_set: List[Job]) -> Job:
+    """
+    Returns the job with the shortest period, the tasks must have their RM priorities assigned
+    """
+    return highest_priority_first(job_set)
+
+def deadline_monotonic(job_set: List[Job]) -> Job:
+    """
+    Returns the job with the shortest task deadline, the tasks must have their DM priorities assigned
+    """
+    return highest_priority_first(job_set)
+
+
+@dataclass(frozen=True)
+class SchedulingPolicy:
+    name: str
+    # pick the job to run among the pending jobs, None for round robin that has its own simulator
+    select_job: Callable[[List[Job]], Job]
+    # key of the static priority of a task, the smaller the higher, None for dynamic priorities
+    task_priority_key: Callable[[Task], int] = None
+    # a synchronous taskset can stop being simulated at its first idle point (Corollary 59, Theorem 40)
+    stops_at_idle_point: bool = False
+    # the synchronous arrival is the worst case, so a schedulable synchronous taskset stays schedulable with offsets
+    synchronous_is_worst_case: bool = False
+
+    @property
+    def is_fixed_priority(self) -> bool:
+        return self.task_priority_key is not None
+
+    @property
+    def is_round_robin(self) -> bool:
+        return self.select_job is None
+
+    def task_priorities(self, task_set: TaskSet) -> dict:
+        """
+        Static priority of each task (task_id -> priority, 0 is the highest), computed once per taskset
+        instead of comparing tasks every tick, the simulators give it to the jobs. Ties are broken by task id.
+        Empty for dynamic priorities
+        """
+        if not self.is_fixed_priority:
+            return {}
+        return {task.task_id: priority for priority, task in enumerate(self.sort_by_priority(task_set.tasks))}
+
+    def sort_by_priority(self, tasks: List[Task]) -> List[Task]:
+        """
+        Return the tasks from the highest to the lowest priority
+        """
+        return sorted(tasks, key=lambda task: (self.task_priority_key(task), task.task_id))
+
+
+SCHEDULING_POLICIES = {
+    "edf": SchedulingPolicy("edf", early_deadline_first,
+                            stops_at_idle_point=True, synchronous_is_worst_case=True),
+    "dm": SchedulingPolicy("dm", deadline_monotonic, task_priority_key=lambda task: task.deadline,
+                           stops_at_idle_point=True, synchronous_is_worst_case=True),
+    "rm": SchedulingPolicy("rm", rate_monotonic, task_priority_key=lambda task: task.period,
+                           stops_at_idle_point=True, synchronous_is_worst_case=True),
+    "rr": SchedulingPolicy("rr", None),
+}
+
+def get_policy(policy) -> SchedulingPolicy:
+    """
+    Return the SchedulingPolicy of a name ('edf', 'dm', 'rm', 'rr'), a job selection function, or a policy
+    """
+    if isinstance(policy, SchedulingPolicy):
+        return policy
+    if isinstance(policy, str):
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"Unknown scheduling policy {policy}, choose from {', '.join(SCHEDULING_POLICIES)}")
+        return SCHEDULING_POLICIES[policy]
+    for scheduling_policy in SCHEDULING_POLICIES.values():
+        if scheduling_policy.select_job == policy:
+            return scheduling_policy
+    raise ValueError(f"No scheduling policy for the function {policy}")
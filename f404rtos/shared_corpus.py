@@ -0,0 +1,111 @@
+# Purpose: Share a corpus of tasksets and the results of their analysis between processes.
+# The tasks, the verdicts and the partitions sit in shared memory as flat int64 arrays,
+# the workers only receive the index of their taskset instead of pickled TaskSet, Task and Processor objects
+import array
+from multiprocessing import shared_memory
+from typing import List
+from . import datatypes
+from .datatypes import TaskSet
+
+# one task is O, C, D, T like a line of a taskset file
+TASK_FIELDS = 4
+# one result per taskset and configuration, times in nanoseconds to stay in int64
+RESULT_FIELDS = ["exit_code", "is_feasible", "need_simulation", "cannot_tell", "time_ns", "repaired_tasks"]
+# processor index of a task that was not assigned (global versions, or a partition that failed)
+UNASSIGNED = -1
+
+def _create_block(num_values: int) -> shared_memory.SharedMemory:
+    # a block cannot be empty
+    return shared_memory.SharedMemory(create=True, size=max(1, num_values) * 8)
+
+class SharedCorpus:
+    """
+    Four int64 arrays in shared memory:
+      offsets[i] .. offsets[i+1]  the tasks of taskset i
+      tasks                       O, C, D, T of every task of the corpus, one after the other
+      results                     RESULT_FIELDS of every (taskset, configuration)
+      assignments                 processor of every task of the corpus, for every configuration
+    The process that creates the corpus owns the blocks and must close() it, the workers attach() to it
+    """
+    def __init__(self, blocks: List[shared_memory.SharedMemory], num_tasksets: int, num_tasks: int,
+                 num_configurations: int, is_owner: bool) -> None:
+        self.blocks = blocks
+        self.num_tasksets = num_tasksets
+        self.num_tasks = num_tasks
+        self.num_configurations = num_configurations
+        self.is_owner = is_owner
+        self.offsets, self.tasks, self.results, self.assignments = [block.buf.cast("q") for block in blocks]
+
+    @classmethod
+    def create(cls, task_sets: List[TaskSet], num_configurations: int) -> 'SharedCorpus':
+        num_tasks = sum(len(task_set.tasks) for task_set in task_sets)
+        blocks = [_create_block(len(task_sets) + 1),
+                  _create_block(num_tasks * TASK_FIELDS),
+                  _create_block(len(task_sets) * num_configurations * len(RESULT_FIELDS)),
+                  _create_block(num_configurations * num_tasks)]
+        corpus = cls(blocks, len(task_sets), num_tasks, num_configurations, is_owner=True)
+
+        offset = 0
+        for i, task_set in enumerate(task_sets):
+            corpus.offsets[i] = offset
+            for task in task_set.tasks:
+                corpus.tasks[offset * TASK_FIELDS:(offset + 1) * TASK_FIELDS] = array.array(
+                    "q", [task.offset, task.computation_time, task.deadline, task.period])
+                offset += 1
+        corpus.offsets[len(task_sets)] = offset
+        corpus.assignments[:] = array.array("q", [UNASSIGNED] * len(corpus.assignments))
+        return corpus
+
+    def descriptor(self) -> tuple:
+        """
+        What a worker needs to attach to the corpus, small enough to be sent once per process
+        """
+        return ([block.name for block in self.blocks], self.num_tasksets, self.num_tasks, self.num_configurations)
+
+    @classmethod
+    def attach(cls, descriptor: tuple) -> 'SharedCorpus':
+        names, num_tasksets, num_tasks, num_configurations = descriptor
+        blocks = [shared_memory.SharedMemory(name=name) for name in names]
+        return cls(blocks, num_tasksets, num_tasks, num_configurations, is_owner=False)
+
+    def close(self) -> None:
+        # the views must be released before their block is closed
+        for view in [self.offsets, self.tasks, self.results, self.assignments]:
+            view.release()
+        for block in self.blocks:
+            block.close()
+            if self.is_owner:
+                block.unlink()
+
+    def read_taskset(self, taskset_index: int) -> TaskSet:
+        """
+        Build the TaskSet of taskset_index, like main.read_taskset does from its file
+        """
+        tasks = []
+        first_task = self.offsets[taskset_index]
+        for i in range(self.offsets[taskset_index + 1] - first_task):
+            position = (first_task + i) * TASK_FIELDS
+            O, C, D, T = self.tasks[position:position + TASK_FIELDS]
+            tasks.append(datatypes.Task(task_id=i, name="Task_" + str(i), offset=O,
+                                        computation_time=C, deadline=D, period=T))
+        return TaskSet(tasks)
+
+    def write_result(self, taskset_index: int, configuration_index: int, values: List[int]) -> None:
+        position = (taskset_index * self.num_configurations + configuration_index) * len(RESULT_FIELDS)
+        self.results[position:position + len(RESULT_FIELDS)] = array.array("q", values)
+
+    def read_result(self, taskset_index: int, configuration_index: int) -> dict:
+        position = (taskset_index * self.num_configurations + configuration_index) * len(RESULT_FIELDS)
+        return dict(zip(RESULT_FIELDS, self.results[position:position + len(RESULT_FIELDS)]))
+
+    def write_assignment(self, taskset_index: int, configuration_index: int, processor_of_task: dict) -> None:
+        """
+        processor_of_task maps the task_id (the index of the task in its taskset) to the processor index
+        """
+        first_task = configuration_index * self.num_tasks + self.offsets[taskset_index]
+        for task_id, processor_index in processor_of_task.items():
+            self.assignments[first_task + task_id] = processor_index
+
+    def read_assignment(self, taskset_index: int, configuration_index: int) -> List[int]:
+        first_task = configuration_index * self.num_tasks + self.offsets[taskset_index]
+        return self.assignments[first_task:first_task + self.offsets[taskset_index + 1] - self.offsets[taskset_index]].tolist()
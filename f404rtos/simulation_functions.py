@@ -0,0 +1,582 @@
+from .datatypes import *
+from .scheduling_functions import *
+from typing import List
+from collections import deque
+import heapq
+import itertools
+from . import myglobal
+import time
+
+
+def log(processor: 'Processor', log_message: str) -> None:
+    if processor:
+        processor.log.append(log_message)
+    else:
+        print(log_message)
+
+def stop_time(miss_handling: MissHandling) -> float:
+    """
+    Returns the time.perf_counter() at which the simulation must stop, None if it has no time budget
+    """
+    if miss_handling is None or miss_handling.time_budget is None:
+        return None
+    return time.perf_counter() + miss_handling.time_budget
+
+def handle_misses(task_set: TaskSet, missed_jobs: List[Job], current_time: int, misses: int,
+                  miss_handling: MissHandling, processor: 'Processor', stats: SimulationStats) -> bool:
+    """
+    Log the jobs that just missed their deadline and apply the miss policy to them, misses counts them too.
+    Returns True if the simulation must stop: at the first miss without miss_handling, or after max_misses misses
+    """
+    if miss_handling is None:
+        log(processor, f"Deadline missed for job {missed_jobs[0].name} at time {task_set.to_original_time(current_time)}")
+        if stats is not None:
+            stats.task(missed_jobs[0].task_id).misses += 1
+        return True
+    for job in missed_jobs:
+        job.missed = True
+        log(processor, f"Deadline missed for job {job.name} at time {task_set.to_original_time(current_time)}")
+        if stats is not None:
+            stats.task(job.task_id).misses += 1
+        if miss_handling.policy == "abort":
+            if stats is not None:
+                stats.job_late(job.task_id, task_set.to_original_time(current_time - job.deadline))
+            # dropped, the simulators forget the jobs with nothing left to compute
+            job.computing_time = 0
+    if miss_handling.max_misses is not None and misses >= miss_handling.max_misses:
+        log(processor, f"{misses} deadline misses, stop simulation at time {task_set.to_original_time(current_time)}")
+        return True
+    return False
+
+def push_deadlines(deadlines: list, jobs: List[Job], release_counter) -> None:
+    """
+    Add released jobs to the min-heap of pending deadlines, as (deadline, release number, job)
+    """
+    for job in jobs:
+        heapq.heappush(deadlines, (job.deadline, next(release_counter), job))
+
+def pop_missed_jobs(deadlines: list, current_time: int) -> List[Job]:
+    """
+    Returns the jobs of the deadline heap that are late at current_time, in their release order,
+    so the miss check is one comparison with the earliest deadline instead of a loop over the pending jobs.
+    Completed jobs are only dropped when they reach the top, a late job leaves the heap once its miss is handled
+    """
+    missed = []
+    while deadlines and (deadlines[0][2].computing_time == 0 or deadlines[0][2].deadline_missed(current_time)):
+        entry = heapq.heappop(deadlines)
+        if entry[2].computing_time > 0:
+            missed.append(entry)
+    missed.sort(key=lambda entry: entry[1])
+    return [job for _, _, job in missed]
+
+def budget_exhausted(task_set: TaskSet, current_time: int, simulation_stop_time: float, processor: 'Processor') -> bool:
+    if simulation_stop_time is None or time.perf_counter() < simulation_stop_time:
+        return False
+    log(processor, f"time budget exhausted, stop simulation at time {task_set.to_original_time(current_time)}")
+    return True
+
+class PendingJobs:
+    """
+    The pending jobs of a task, oldest first. With arbitrary deadlines (D > T) several jobs of a task can be pending,
+    but under EDF and fixed priorities only the oldest one can run: it is the only Job kept (the head, with its
+    remaining work), the others are kept as their release times until they become the head.
+    position is the index of the task in the taskset, the heads are ordered like the jobs were released,
+    time_scale the one of the taskset, for the names of the jobs
+    """
+    def __init__(self, task: Task, position: int, priority: int, time_scale: int = 1) -> None:
+        self.task = task
+        self.position = position
+        self.priority = priority
+        self.time_scale = time_scale
+        self.head = None
+        self.releases = deque()
+        # number of pending jobs, from the head, whose deadline miss was already handled (they complete late)
+        self.missed = 0
+        # deadline of the entry of the task in the deadline heap of schedule, see track_deadline
+        self.tracked_deadline = None
+
+    def new_job(self, release_time: int) -> Job:
+        job = self.task.release_job(release_time, self.time_scale)
+        job.priority = self.priority
+        return job
+
+    def release(self, release_time: int) -> Job:
+        """
+        Add the job released at release_time, returns it if it is the new head
+        """
+        if self.head is not None:
+            self.releases.append(release_time)
+            return None
+        self.head = self.new_job(release_time)
+        return self.head
+
+    def next_head(self) -> Job:
+        """
+        Drop the head (completed or aborted), returns the next pending job as the new head, None if there is none
+        """
+        self.head = None
+        if self.missed > 0:
+            self.missed -= 1
+        if self.releases:
+            self.head = self.new_job(self.releases.popleft())
+            self.head.missed = self.missed > 0
+        return self.head
+
+    def next_deadline(self) -> int:
+        """
+        Deadline of the oldest pending job whose miss is not handled yet, None if there is none
+        """
+        if self.head is None or self.missed > len(self.releases):
+            return None
+        release_time = self.head.release_time if self.missed == 0 else self.releases[self.missed - 1]
+        return release_time + self.task.deadline
+
+    def late_jobs(self, current_time: int) -> List[Job]:
+        """
+        Returns the pending jobs late at current_time whose miss is not handled yet, as Job objects.
+        Their deadlines follow the release order, so they come after the jobs already missed
+        """
+        late = []
+        if self.head is None:
+            return late
+        index = self.missed
+        while index <= len(self.releases):
+            release_time = self.head.release_time if index == 0 else self.releases[index - 1]
+            if current_time < release_time + self.task.deadline:
+                break
+            late.append(self.head if index == 0 else self.new_job(release_time))
+            index += 1
+        return late
+
+    def handled(self, late: List[Job]) -> Job:
+        """
+        Apply the miss policy to the jobs of late_jobs: aborted jobs leave, the others complete late.
+        Returns the new head if the head was aborted (it may be None), otherwise the head
+        """
+        if not late or late[0].computing_time > 0:
+            self.missed += len(late)
+            return self.head
+        # aborted, they are the oldest pending jobs
+        for _ in range(len(late) - 1):
+            self.releases.popleft()
+        return self.next_head()
+
+def track_deadline(deadlines: list, queue: PendingJobs) -> None:
+    """
+    Push the next deadline of queue to the min-heap of (deadline, position, queue) if it changed.
+    The next deadline of a task only grows, an entry whose deadline is no longer the tracked one is dropped when it reaches the top
+    """
+    deadline = queue.next_deadline()
+    if deadline != queue.tracked_deadline:
+        queue.tracked_deadline = deadline
+        if deadline is not None:
+            heapq.heappush(deadlines, (deadline, queue.position, queue))
+
+def pop_late_queues(deadlines: list, current_time: int) -> List[PendingJobs]:
+    """
+    Returns the tasks with a pending job late at current_time whose miss is not handled yet, in the taskset order,
+    so the miss check is one comparison with the earliest tracked deadline instead of a loop over the tasks
+    """
+    late = []
+    while deadlines and current_time >= deadlines[0][0]:
+        deadline, _, queue = heapq.heappop(deadlines)
+        if deadline == queue.tracked_deadline:
+            queue.tracked_deadline = None
+            late.append(queue)
+    late.sort(key=lambda queue: queue.position)
+    return late
+
+def add_ready(ready: List[Job], job: Job, positions: dict) -> None:
+    """
+    Insert a head in the ready jobs, ordered by release time then task like the jobs were released,
+    so the ties of the policy are broken as with every pending job in one list
+    """
+    key = (job.release_time, positions[job.task_id])
+    index = len(ready)
+    while index > 0 and (ready[index - 1].release_time, positions[ready[index - 1].task_id]) > key:
+        index -= 1
+    ready.insert(index, job)
+
+def schedule(task_set: TaskSet, scheduling_function, 
+             time_max: int, time_step: int, processor: 'Processor' = None,
+             stats: SimulationStats = None, miss_handling: MissHandling = None) -> NewBool:
+    """
+    Schedule jobs from the task set using the given scheduling policy (a SchedulingPolicy, its name or its job selection function) and time step
+    Save logs to the processor's log attribute if provided, otherwise print
+    Fill stats with the response times, slacks and preemptions of each task if provided
+    Stop at the first deadline miss, or go on as miss_handling says if provided
+    The pending jobs of each task are kept in its PendingJobs, so the policy selects among at most one job per task
+    """
+    policy = get_policy(scheduling_function)
+    if policy.is_round_robin:
+        return schedule_round_robin(task_set, time_max, time_step, time_step, processor, stats, miss_handling)
+    priorities = policy.task_priorities(task_set)
+
+    pending = [PendingJobs(task, position, priorities.get(task.task_id, 0), task_set.time_scale)
+               for position, task in enumerate(task_set.tasks)]
+    pending_of_task = {queue.task.task_id: queue for queue in pending}
+    positions = {queue.task.task_id: queue.position for queue in pending}
+    # oldest pending job of each task, in release order
+    jobs: List[Job] = []
+    # min-heap of the next deadline of each task, see track_deadline
+    deadlines = []
+    # job that ran on the previous step, preempted if another one is selected before it completes
+    previous_job = None
+    misses = 0
+    simulation_stop_time = stop_time(miss_handling)
+    current_time = 0
+    synchronous_flag = task_set.is_synchronous
+    if processor: processor.log.append(f"task_set.is_synchronous:{synchronous_flag}, policy:{policy.name}")
+    while current_time < time_max:
+        if myglobal.global_stop_flag.is_set():
+            log_message = f"other processor failed, stop simulation at time {task_set.to_original_time(current_time)}"
+            if processor:
+                processor.log.append(log_message)
+            else:
+                print(log_message)
+            return NewBool.CANNOT_TELL
+        if budget_exhausted(task_set, current_time, simulation_stop_time, processor):
+            return NewBool.FALSE if misses > 0 else NewBool.CANNOT_TELL
+
+        if  synchronous_flag and jobs == [] and current_time > 0:
+            # if taskset is synchronous and find an idle points!
+            if policy.stops_at_idle_point:
+                # Idle point in EDF (Corollary 59), end of the synchronous busy period in FTP (Theorem 40)
+                log_message = f"{policy.name.upper()}: synchronous taskset with Idle point at time {task_set.to_original_time(current_time)}"
+                if processor:
+                    processor.log.append(log_message)
+                else:
+                    print(log_message)
+                return NewBool.FALSE if misses > 0 else NewBool.TRUE
+        # release the new jobs, a job becomes ready when the previous jobs of its task are done
+        for queue in pending:
+            task = queue.task
+            if current_time >= task.offset and (current_time - task.offset) % task.period == 0:
+                head = queue.release(current_time)
+                if head is not None:
+                    jobs.append(head)
+                # a new job only becomes the next deadline of a task whose pending jobs are all missed or done
+                if queue.tracked_deadline is None:
+                    track_deadline(deadlines, queue)
+        late = [(queue, queue.late_jobs(current_time)) for queue in pop_late_queues(deadlines, current_time)]
+        if late:
+            missed_jobs = sorted((job for _, late_jobs in late for job in late_jobs),
+                                 key=lambda job: (job.release_time, positions[job.task_id]))
+            misses += len(missed_jobs)
+            if handle_misses(task_set, missed_jobs, current_time, misses, miss_handling, processor, stats):
+                return NewBool.FALSE
+            for queue, late_jobs in late:
+                head = queue.head
+                if queue.handled(late_jobs) is not head:
+                    jobs.remove(head)
+                    if queue.head is not None:
+                        add_ready(jobs, queue.head, positions)
+                track_deadline(deadlines, queue)
+        # schedule the job with the highest priority
+        job = policy.select_job(jobs)
+        if stats is not None:
+            if previous_job is not None and previous_job is not job and previous_job.computing_time > 0:
+                stats.task(previous_job.task_id).preemptions += 1
+            previous_job = job
+        if job is not None:
+            run_time = min(job.computing_time, time_step)
+            job.schedule(time_step)
+            if job.computing_time == 0:
+                jobs.remove(job)
+                if stats is not None:
+                    record_completion(task_set, job, current_time + run_time, stats)
+                queue = pending_of_task[job.task_id]
+                head = queue.next_head()
+                if head is not None:
+                    add_ready(jobs, head, positions)
+                track_deadline(deadlines, queue)
+        # move to next step, let the simulations of the other processors run
+        if processor: time.sleep(1e-5)
+        current_time += time_step
+    return NewBool.FALSE if misses > 0 else NewBool.TRUE
+
+def record_completion(task_set: TaskSet, job: Job, completion_time: int, stats: SimulationStats) -> None:
+    stats.job_completed(job.task_id,
+                        task_set.to_original_time(completion_time - job.release_time),
+                        task_set.to_original_time(job.deadline - completion_time))
+    if job.missed:
+        stats.job_late(job.task_id, task_set.to_original_time(completion_time - job.deadline))
+
+def schedule_round_robin(task_set: TaskSet, time_max: int, time_step: int, quantum: int,
+                         processor: 'Processor' = None, stats: SimulationStats = None,
+                         miss_handling: MissHandling = None) -> NewBool:
+    """
+    Schedule jobs from the task set with round robin, jumping from event to event instead of tick by tick.
+    An event is a release, the end of the running job or of its quantum, or the first tick a pending job is late.
+    The running job goes back to the tail of the queue when it is dispatched,
+    so the jobs released while it runs are queued after it.
+    Save logs to the processor's log attribute if provided, otherwise print, fill stats if provided.
+    Stop at the first deadline miss, or go on as miss_handling says if provided
+    """
+    queue = deque()
+    # jobs released while the running job uses its quantum, queued after it
+    released_while_running = []
+    running_job = None
+    quantum_left = 0
+    # pending deadlines, see pop_missed_jobs
+    deadlines = []
+    release_counter = itertools.count()
+    releases = [(task.offset, task.task_id, task) for task in task_set.tasks]
+    heapq.heapify(releases)
+    misses = 0
+    simulation_stop_time = stop_time(miss_handling)
+
+    current_time = 0
+    while current_time < time_max:
+        if myglobal.global_stop_flag.is_set():
+            log_message = f"other processor failed, stop simulation at time {task_set.to_original_time(current_time)}"
+            if processor:
+                processor.log.append(log_message)
+            else:
+                print(log_message)
+            return NewBool.CANNOT_TELL
+        if budget_exhausted(task_set, current_time, simulation_stop_time, processor):
+            return NewBool.FALSE if misses > 0 else NewBool.CANNOT_TELL
+
+        # jobs = old jobs + new jobs
+        while releases and releases[0][0] == current_time:
+            _, task_id, task = heapq.heappop(releases)
+            job = task.release_job(current_time, task_set.time_scale)
+            push_deadlines(deadlines, [job], release_counter)
+            if running_job is not None:
+                released_while_running.append(job)
+            else:
+                queue.append(job)
+            heapq.heappush(releases, (current_time + task.period, task_id, task))
+
+        missed_jobs = pop_missed_jobs(deadlines, current_time)
+        if missed_jobs:
+            misses += len(missed_jobs)
+            if handle_misses(task_set, missed_jobs, current_time, misses, miss_handling, processor, stats):
+                return NewBool.FALSE
+            if running_job is not None and running_job.computing_time == 0:
+                # the running job was aborted
+                queue.extend(released_while_running)
+                released_while_running.clear()
+                running_job = None
+
+        # aborted jobs are dropped when they reach the head of the queue
+        while queue and queue[0].computing_time == 0:
+            queue.popleft()
+        if running_job is None and queue:
+            running_job = queue.popleft()
+            quantum_left = quantum
+
+        # next event
+        next_time = time_max
+        if releases:
+            next_time = min(next_time, releases[0][0])
+        if deadlines:
+            # the earliest pending deadline, the job is late if it has work left then
+            next_time = min(next_time, deadlines[0][0])
+        if running_job is None:
+            current_time = next_time
+            continue
+        run_time = min(next_time - current_time, quantum_left, running_job.computing_time)
+        running_job.schedule(run_time)
+        quantum_left -= run_time
+        current_time += run_time
+
+        if running_job.computing_time == 0 or quantum_left == 0:
+            if running_job.computing_time > 0:
+                queue.append(running_job)
+                # a job alone in the queue runs again at once, it is not preempted
+                if stats is not None and len(queue) + len(released_while_running) > 1:
+                    stats.task(running_job.task_id).preemptions += 1
+            elif stats is not None:
+                record_completion(task_set, running_job, current_time, stats)
+            queue.extend(released_while_running)
+            released_while_running.clear()
+            running_job = None
+    return NewBool.FALSE if misses > 0 else NewBool.TRUE
+
+def dispatch_global(selected: List[Job], running: dict, last_cores: dict, num_cores: int, stats: SimulationStats) -> dict:
+    """
+    Give a core to each selected job of a global simulation, and count the preemptions and migrations.
+    running maps id(job) -> (job, core) for the jobs of the previous step, last_cores id(job) -> the core a job last ran on.
+    A job that keeps running keeps its core, a job that resumes takes its last core if it is free.
+    Returns running for this step
+    """
+    selected_ids = {id(job) for job in selected}
+    for job, core in running.values():
+        if id(job) not in selected_ids and job.computing_time > 0:
+            stats.task(job.task_id).preemptions += 1
+    now_running = {id(job): running[id(job)] for job in selected if id(job) in running}
+    free_cores = set(range(num_cores)) - {core for _, core in now_running.values()}
+    for job in selected:
+        if id(job) in now_running:
+            continue
+        last_core = last_cores.get(id(job))
+        core = last_core if last_core in free_cores else min(free_cores)
+        free_cores.remove(core)
+        if last_core is not None and last_core != core:
+            stats.task(job.task_id).migrations += 1
+        now_running[id(job)] = (job, core)
+        last_cores[id(job)] = core
+    return now_running
+
+def run_global_step(task_set: TaskSet, jobs: List[Job], current_time: int, time_step: int, num_cores: int,
+                    running: dict, last_cores: dict, stats: SimulationStats) -> dict:
+    """
+    Run the first num_cores jobs for a time step, fill stats if provided. Returns running, see dispatch_global
+    """
+    selected = jobs[:num_cores]
+    if stats is not None:
+        running = dispatch_global(selected, running, last_cores, num_cores, stats)
+    for job in selected:
+        run_time = min(job.computing_time, time_step)
+        job.schedule(time_step)
+        if job.computing_time == 0 and stats is not None:
+            record_completion(task_set, job, current_time + run_time, stats)
+            del last_cores[id(job)]
+    return running
+
+def sorted_missed_jobs(jobs: List[Job], current_time: int) -> List[Job]:
+    """
+    Returns the jobs that are late at current_time and whose miss was not handled yet, when jobs are sorted by deadline
+    followed by the jobs just released (global EDF): the late jobs are a prefix of jobs, the scan stops at the first
+    job that is on time instead of going through all the pending jobs
+    """
+    missed_jobs = []
+    for job in jobs:
+        if not job.deadline_missed(current_time):
+            break
+        if not job.missed:
+            missed_jobs.append(job)
+    return missed_jobs
+
+def check_global_misses(task_set: TaskSet, jobs: List[Job], missed_jobs: List[Job], current_time: int, misses: int,
+                        miss_handling: MissHandling, last_cores: dict, stats: SimulationStats,
+                        processor: 'Processor' = None):
+    """
+    Handle the deadline misses of a step of a global simulation, see handle_misses.
+    missed_jobs: the jobs that are late at current_time, e.g. from sorted_missed_jobs or pop_missed_jobs
+    processor: the cluster the misses are logged to, if provided
+    Returns the jobs left, the number of misses so far, and True if the simulation must stop
+    """
+    if not missed_jobs:
+        return jobs, misses, False
+    misses += len(missed_jobs)
+    if handle_misses(task_set, missed_jobs, current_time, misses, miss_handling, processor, stats):
+        return jobs, misses, True
+    for job in missed_jobs:
+        if job.computing_time == 0:
+            # aborted, its id may be reused by a new job
+            last_cores.pop(id(job), None)
+    return [job for job in jobs if job.computing_time > 0], misses, False
+
+def schedule_global_edf(task_set: TaskSet, time_max: int, time_step: int, num_cores: int,
+                        stats: SimulationStats = None, miss_handling: MissHandling = None,
+                        processor: 'Processor' = None) -> bool:
+    """
+    Schedule jobs from the task set using the global EDF scheduling algorithm
+    Fill stats with the response times, slacks, preemptions and migrations of each task if provided
+    Stop at the first deadline miss, or go on as miss_handling says if provided
+    (NewBool.CANNOT_TELL is returned if its time budget runs out before a miss)
+    processor is the cluster of clustered EDF that is simulated, if provided: the logs are saved to it
+    and the simulation stops when another cluster failed
+    """
+    # for now single threaded implementation
+    jobs: List[Job] = []
+    # jobs of the previous step and their cores, for the statistics
+    running = {}
+    last_cores = {}
+    misses = 0
+    simulation_stop_time = stop_time(miss_handling)
+    current_time = 0
+
+    while current_time < time_max:
+        if processor is not None and myglobal.global_stop_flag.is_set():
+            log(processor, f"other cluster failed, stop simulation at time {task_set.to_original_time(current_time)}")
+            return NewBool.CANNOT_TELL
+        if budget_exhausted(task_set, current_time, simulation_stop_time, processor):
+            return False if misses > 0 else NewBool.CANNOT_TELL
+        # Release new jobs at current time
+        jobs.extend(task_set.release_jobs(current_time))
+
+        # Check for deadline misses, jobs is still sorted by deadline from the previous step
+        jobs, misses, stop = check_global_misses(task_set, jobs, sorted_missed_jobs(jobs, current_time), current_time,
+                                                 misses, miss_handling, last_cores, stats, processor=processor)
+        if stop:
+            return False
+
+        # Sort jobs by earliest deadline
+        jobs.sort(key=lambda job: job.deadline)
+
+        # Schedule selected jobs
+        running = run_global_step(task_set, jobs, current_time, time_step, num_cores, running, last_cores, stats)
+
+        # Remove completed jobs
+        jobs = [job for job in jobs if job.computing_time > 0]
+
+        current_time += time_step
+
+    return misses == 0
+
+def schedule_global_edf_k(task_set: TaskSet, time_max: int, time_step: int, k_value: int, num_cores: int,
+                          presorted: bool = False, stats: SimulationStats = None,
+                          miss_handling: MissHandling = None) -> bool:
+    """
+    Schedule jobs from the task set using the global EDF(k) scheduling algorithm:
+    the k-1 tasks of largest utilisation have the highest priority, the others are scheduled by EDF (Theorem 93)
+    presorted: the tasks are already sorted by decreasing utilisation, e.g. by the preprocessor
+    Fill stats with the response times, slacks, preemptions and migrations of each task if provided
+    Stop at the first deadline miss, or go on as miss_handling says if provided, like schedule_global_edf
+    """
+    if not presorted:
+        task_set = task_set.by_decreasing_utilization
+    schedulable = True
+    jobs: List[Job] = []
+    deadlines = []
+    release_counter = itertools.count()
+    running = {}
+    last_cores = {}
+    misses = 0
+    simulation_stop_time = stop_time(miss_handling)
+    current_time = 0
+    taskset_in_k = task_set.with_tasks(task_set.tasks[:k_value-1])
+    task_set_out_k = task_set.with_tasks(task_set.tasks[k_value-1:])
+
+    while current_time < time_max:
+        if budget_exhausted(task_set, current_time, simulation_stop_time, None):
+            return False if misses > 0 else NewBool.CANNOT_TELL
+        # the k-1 tasks of largest utilisation first
+        new_jobs_in_k = taskset_in_k.release_jobs(current_time)
+        for job in new_jobs_in_k:
+            job.priority = -1000 # set the priority to a very low value represent -infinity
+        jobs.extend(new_jobs_in_k)
+        
+        # Release new jobs at current time
+        new_jobs_out_k = task_set_out_k.release_jobs(current_time)
+        for new_job in new_jobs_out_k:
+            new_job.priority = new_job.deadline
+        jobs.extend(new_jobs_out_k)
+        push_deadlines(deadlines, new_jobs_in_k + new_jobs_out_k, release_counter)
+
+        # Check for deadline misses
+        # the late jobs are reported by priority, like they are ordered in jobs
+        missed_jobs = sorted(pop_missed_jobs(deadlines, current_time), key=lambda job: job.priority)
+        jobs, misses, stop = check_global_misses(task_set, jobs, missed_jobs, current_time, misses, miss_handling,
+                                                 last_cores, stats)
+        if stop:
+            schedulable = False
+            return schedulable
+
+        # Sort jobs by earliest deadline
+        jobs.sort(key=lambda job: job.priority)
+
+        # Schedule selected jobs
+        running = run_global_step(task_set, jobs, current_time, time_step, num_cores, running, last_cores, stats)
+        
+        # Remove completed jobs
+        jobs = [job for job in jobs if job.computing_time > 0]
+
+        current_time += time_step
+
+    schedulable = misses == 0
+    return schedulable
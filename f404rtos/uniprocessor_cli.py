@@ -0,0 +1,50 @@
+# Purpose: Command line interface of the uniprocessor analyses, see Project1/src/main.py
+import argparse
+
+from .analysis import read_taskset, run_uniprocessor, exit_code
+from .datatypes import SimulationStats, MissHandling, MISS_POLICIES
+from .scheduling_functions import SCHEDULING_POLICIES
+
+def parseArgs():
+    """
+    parse command line arguments
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("algorithm", help="Scheduling algorithm", choices=list(SCHEDULING_POLICIES))
+    parser.add_argument("file", help="TaskSet file")
+    parser.add_argument("-q", type=int, help="Time quantum for rr (default: the simulator timestep)")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print the response times, slacks and preemptions of each task observed by the simulation")
+    parser.add_argument("--misses", choices=MISS_POLICIES,
+                        help="Go on simulating after a deadline miss, 'abort' drops the late job, 'skip' lets it complete late, "
+                             "and print the misses and the largest tardiness of each task (implies --stats)")
+    parser.add_argument("--max-misses", type=int, help="With --misses, stop the simulation after this number of misses")
+    parser.add_argument("--time-budget", type=float, help="With --misses, stop the simulation after this number of seconds")
+    args = parser.parse_args()
+
+    if (args.max_misses is not None or args.time_budget is not None) and args.misses is None:
+        parser.error("--max-misses and --time-budget go with --misses")
+    return args
+
+def main():
+    args = parseArgs()
+    task_set = read_taskset(args.file)
+    print(task_set)
+
+    stats = SimulationStats() if args.stats or args.misses is not None else None
+    miss_handling = MissHandling(args.misses, args.max_misses, args.time_budget) if args.misses is not None else None
+    is_feasible, need_simulation, cannot_tell = run_uniprocessor(task_set, args.algorithm, args.q, stats, miss_handling)
+    if need_simulation:
+        print(f"Simulation passed? : {is_feasible}")
+    else:
+        print("Simulation is not needed")
+        print(f"Feasibility check passed? : {is_feasible}")
+    if stats is not None:
+        print(stats if stats.tasks else "No simulation, no statistics")
+    code = exit_code(is_feasible, need_simulation, cannot_tell)
+    print(f"exit {code}")
+    exit(code)
+
+
+if __name__ == "__main__":
+    main()